@@ -13,19 +13,241 @@ How it works for N-Puzzle:
 - Stop when we reach the goal state
 - This guarantees the solution has minimum moves!
 
+Bidirectional search:
+- The goal state is known in advance, so we also search backwards from it
+- Each side only has to go about half the depth before the two meet
+- That turns O(b^d) into roughly O(2 * b^(d/2)) states
+
 Time Complexity: O(b^d) where b=branching factor, d=depth
 Space Complexity: O(b^d) - stores all nodes at current level
 """
 
-from collections import deque
-from typing import List, Optional, Tuple
-from puzzle_logic import Puzzle
+import logging
+import os
+from functools import lru_cache
+from typing import Callable, List, Optional, Tuple
+# Moves travel through the search as small ints, the same codes Puzzle
+# uses (an index into MOVE_NAMES, with code ^ 1 the opposite move)
+from puzzle_logic import MOVE_NAMES, Puzzle, _MOVE_CODES
+
+
+class SolveCancelled(Exception):
+    """Raised inside a search when the caller asked it to stop early."""
+
+
+def encode_solution(moves: List[str]) -> bytes:
+    """
+    Turn a list of move names into bytes, one move code per byte.
+    len() of the result is the number of moves.
+    """
+    return bytes(_MOVE_CODES[move] for move in moves)
+
+
+def decode_solution(codes: bytes) -> List[str]:
+    """Turn move-code bytes back into move names ('up', 'down', ...)."""
+    return [MOVE_NAMES[code] for code in codes]
+
+
+def _tile_bits(size: int) -> int:
+    """
+    Bits needed per tile: 4 covers tiles 0-15, 5 covers the 24-puzzle.
+    Same layout as Puzzle.packed(): cell i lives at bit offset i * bits.
+    """
+    return 4 if size <= 4 else 5
+
+
+@lru_cache(maxsize=None)
+def _goal_state(size: int) -> int:
+    """The packed solved board (1, 2, ..., n*n-1 then the empty space)."""
+    bits = _tile_bits(size)
+    return sum(tile << (bits * (tile - 1)) for tile in range(1, size * size))
+
+
+@lru_cache(maxsize=None)
+def _neighbor_table(size: int) -> Tuple[Tuple[Tuple[int, int], ...], ...]:
+    """
+    For every blank index, list the (target_index, move_code) pairs it can swap with.
+    Depends only on the board size, so it is computed once per size instead of
+    asking the Puzzle for valid moves at every node.
+    """
+    table = []
+    for idx in range(size * size):
+        row, col = divmod(idx, size)
+        moves = []
+        if row > 0:
+            moves.append((idx - size, 0))  # up
+        if row < size - 1:
+            moves.append((idx + size, 1))  # down
+        if col > 0:
+            moves.append((idx - 1, 2))  # left
+        if col < size - 1:
+            moves.append((idx + 1, 3))  # right
+        table.append(tuple(moves))
+    return tuple(table)
+
+
+def _move_offsets(size: int) -> Tuple[int, int, int, int]:
+    """How far each move code shifts the blank's flat index."""
+    return (-size, size, -1, 1)
+
+
+def _walk_back(visited: dict, state: int, blank: int, size: int, bits: int) -> bytearray:
+    """
+    Follow the stored moves from `state` back to the root of its search.
+    
+    Each visited entry holds only the move that produced the state; the
+    parent is recovered by sliding the tile back, so no per-state tuple
+    is ever allocated. Moves are returned in walking order (newest first).
+    """
+    mask = (1 << bits) - 1
+    offsets = _move_offsets(size)
+    moves = bytearray()
+    move = visited[state]
+    while move is not None:
+        moves.append(move)
+        parent_blank = blank - offsets[move]
+        tile = (state >> (bits * parent_blank)) & mask
+        state = state - (tile << (bits * parent_blank)) + (tile << (bits * blank))
+        blank = parent_blank
+        move = visited[state]
+    return moves
+
+
+def _expand_level(states: List[int], blanks: List[int], visited: dict, other_visited: dict,
+                  neighbors: list, shifts: List[int],
+                  mask: int) -> Tuple[List[int], List[int], Optional[Tuple[int, int]]]:
+    """
+    Expand one full BFS level of one side of the bidirectional search.
+    
+    The frontier is kept as two parallel lists (states[i] has its empty
+    space at blanks[i]) rather than a list of (state, blank) tuples, so
+    no tuple is allocated per queued state.
+    
+    Returns:
+        Tuple of (next_states, next_blanks, meeting). meeting is the
+        (state, blank_index) of the first new state already reached by the
+        other side, or None if the sides haven't met.
+    """
+    next_states = []
+    next_blanks = []
+    push_state = next_states.append
+    push_blank = next_blanks.append
+    for state, blank in zip(states, blanks):
+        blank_shift = shifts[blank]
+        for target, move in neighbors[blank]:
+            # Slide the tile at `target` into the blank (whose bits are 0)
+            target_shift = shifts[target]
+            tile = (state >> target_shift) & mask
+            new_state = state - (tile << target_shift) + (tile << blank_shift)
+            
+            # Only explore if we haven't seen this state before
+            if new_state not in visited:
+                # Remember how we got here instead of copying the path
+                visited[new_state] = move
+                if new_state in other_visited:
+                    return next_states, next_blanks, (new_state, target)
+                push_state(new_state)
+                push_blank(target)
+    return next_states, next_blanks, None
+
+
+def _join_paths(visited_fwd: dict, visited_bwd: dict, meeting: Tuple[int, int],
+                size: int, bits: int) -> bytes:
+    """
+    Combine the forward path (start -> meeting state) with the inverted
+    backward path (meeting state -> goal).
+    """
+    state, blank = meeting
+    path = _walk_back(visited_fwd, state, blank, size, bits)
+    path.reverse()
+    # Undoing a move is the opposite move (code ^ 1)
+    path.extend(move ^ 1 for move in _walk_back(visited_bwd, state, blank, size, bits))
+    return bytes(path)
+
+
+def _bfs_core(start_state: int, start_blank: int, goal_state: int, size: int,
+              neighbors: tuple, is_cancelled: Optional[Callable[[], bool]] = None
+              ) -> Tuple[Optional[bytes], int, int]:
+    """
+    The search itself, working only on plain ints (no Puzzle objects).
+    
+    Args:
+        start_state: Packed start board
+        start_blank: Flat index of the empty space in the start board
+        goal_state: Packed goal board
+        size: Grid size
+        neighbors: Neighbor table from _neighbor_table(size)
+        is_cancelled: Optional callback, checked once per level; the search
+            raises SolveCancelled as soon as it returns True
+        
+    Returns:
+        Tuple of (move codes or None, nodes_explored, max_queue_size)
+    """
+    bits = _tile_bits(size)
+    mask = (1 << bits) - 1
+    shifts = [bits * i for i in range(size * size)]
+    
+    # One BFS level per side: packed states and their blank indexes
+    forward, forward_blanks = [start_state], [start_blank]
+    backward, backward_blanks = [goal_state], [size * size - 1]
+    
+    # Track visited states to avoid cycles
+    # Each state maps to the move that reached it so the path can be rebuilt
+    # (A dict keyed by the packed int beats a flat array indexed by the
+    # permutation's rank: computing the rank costs far more than hashing.)
+    visited_fwd = {start_state: None}
+    visited_bwd = {goal_state: None}
+    max_queue_size = 2
+    
+    while forward and backward:
+        if is_cancelled is not None and is_cancelled():
+            raise SolveCancelled()
+        
+        # Always grow the smaller frontier (the "meet-in-the-middle" rule)
+        if len(forward) <= len(backward):
+            forward, forward_blanks, meeting = _expand_level(
+                forward, forward_blanks, visited_fwd, visited_bwd, neighbors, shifts, mask)
+        else:
+            backward, backward_blanks, meeting = _expand_level(
+                backward, backward_blanks, visited_bwd, visited_fwd, neighbors, shifts, mask)
+        # Sampled once per level (not per node): the peak is always at a
+        # level boundary, so the statistic costs nothing in the inner loop
+        frontier_size = len(forward) + len(backward)
+        if frontier_size > max_queue_size:
+            max_queue_size = frontier_size
+        
+        # Check if the two searches have met!
+        if meeting is not None:
+            path = _join_paths(visited_fwd, visited_bwd, meeting, size, bits)
+            return path, len(visited_fwd) + len(visited_bwd), max_queue_size
+    
+    # If a frontier runs dry before meeting, it's unsolvable
+    return None, len(visited_fwd) + len(visited_bwd), max_queue_size
+
+
+def _trivial_result(puzzle: Puzzle) -> Tuple[bool, Optional[bytes]]:
+    """
+    The checks every solve runs before searching.
+    The cores only spot the goal on newly generated states, so an already
+    solved board has to be answered here; an unsolvable one would make
+    them exhaust half the state space.
+    
+    Returns:
+        (True, b'') if already solved, (True, None) if unsolvable,
+        otherwise (False, None) - the board needs a search
+    """
+    if puzzle.packed() == _goal_state(puzzle.size):
+        return True, b''
+    if not puzzle.is_solvable():
+        return True, None
+    return False, None
 
 
 class BFSSolver:
     """
     Solves the N-Puzzle using Breadth-First Search algorithm.
     Works with any puzzle size (3x3, 4x4, 5x5, etc.)
+    Searches from both the start and the goal until the two frontiers meet.
     """
     
     def __init__(self, puzzle: Puzzle):
@@ -36,57 +258,59 @@ class BFSSolver:
             puzzle: The Puzzle instance to solve (any size)
         """
         self.initial_puzzle = puzzle.copy()
+        # Set to True (e.g. from another thread) to stop a running solve
+        self.cancel = False
+        # Valid moves for each blank position, looked up instead of computed
+        self._neighbors = _neighbor_table(puzzle.size)
+        # Pack the boards once; every solve and goal test is then an int compare
+        start_row, start_col = puzzle.find_empty()
+        self._initial_state = puzzle.packed()
+        self._initial_blank = start_row * puzzle.size + start_col
+        self._goal_state = _goal_state(puzzle.size)
     
-    def solve(self) -> Optional[List[str]]:
+    def _core_args(self) -> tuple:
+        """The plain-int arguments of _bfs_core."""
+        return (self._initial_state, self._initial_blank, self._goal_state,
+                self.initial_puzzle.size, self._neighbors, lambda: self.cancel)
+    
+    def _solve_core(self) -> Tuple[Optional[bytes], dict]:
         """
-        Solve the puzzle using BFS.
+        The one place that runs the search; solve() and solve_with_stats()
+        both go through here, so every optimization covers both.
         
         Returns:
-            List of moves to solve the puzzle, or None if unsolvable
+            Tuple of (move codes or None, statistics_dict)
         """
-        # Check if already solved
-        if self.initial_puzzle.is_goal():
-            return []
+        # Already solved or unsolvable: nothing to search
+        trivial, codes = _trivial_result(self.initial_puzzle)
+        if trivial:
+            return codes, {'nodes_explored': 0, 'solution_length': 0}
         
-        # Check if solvable
-        if not self.initial_puzzle.is_solvable():
-            return None
+        path, nodes_explored, max_queue_size = _bfs_core(*self._core_args())
+        if path is None:
+            return None, {'nodes_explored': nodes_explored, 'solution_length': 0}
         
-        # BFS uses a queue: we'll process states in order
-        # Each element: (puzzle_state, path_to_reach_it)
-        queue = deque([(self.initial_puzzle.copy(), [])])
-        
-        # Track visited states to avoid cycles
-        # (We've seen this puzzle state before, don't explore again)
-        visited = {self.initial_puzzle}
-        
-        # Counter for statistics
-        nodes_explored = 0
+        stats = {
+            'nodes_explored': nodes_explored,
+            'solution_length': len(path),
+            'max_queue_size': max_queue_size
+        }
+        return path, stats
+    
+    def solve(self) -> Optional[List[str]]:
+        """
+        Solve the puzzle using BFS.
         
-        while queue:
-            # Get the next state from the front of the queue (FIFO)
-            current_puzzle, path = queue.popleft()
-            nodes_explored += 1
-            
-            # Check if we've reached the goal!
-            if current_puzzle.is_goal():
-                print(f"✅ Solution found! Explored {nodes_explored} states.")
-                return path
+        Returns:
+            List of moves to solve the puzzle, or None if unsolvable
             
-            # Generate all possible next moves
-            for move in current_puzzle.get_valid_moves():
-                # Create a copy to avoid modifying the original
-                new_puzzle = current_puzzle.copy()
-                new_puzzle.make_move(move)
-                
-                # Only explore if we haven't seen this state before
-                if new_puzzle not in visited:
-                    visited.add(new_puzzle)
-                    # Add to queue with the path that led here
-                    queue.append((new_puzzle, path + [move]))
-        
-        # If queue is empty and we haven't found solution, it's unsolvable
-        return None
+        Raises:
+            SolveCancelled: If `cancel` was set while searching
+        """
+        codes, stats = self._solve_core()
+        if codes:
+            logging.info("BFS solution found, explored %d states", stats['nodes_explored'])
+        return None if codes is None else decode_solution(codes)
     
     def solve_with_stats(self) -> Tuple[Optional[List[str]], dict]:
         """
@@ -94,38 +318,66 @@ class BFSSolver:
         
         Returns:
             Tuple of (solution_path, statistics_dict)
-        """
-        if self.initial_puzzle.is_goal():
-            return [], {'nodes_explored': 0, 'solution_length': 0}
-        
-        if not self.initial_puzzle.is_solvable():
-            return None, {'nodes_explored': 0, 'solution_length': 0}
-        
-        queue = deque([(self.initial_puzzle.copy(), [])])
-        visited = {self.initial_puzzle}
-        nodes_explored = 0
-        max_queue_size = 1
-        
-        while queue:
-            current_puzzle, path = queue.popleft()
-            nodes_explored += 1
-            max_queue_size = max(max_queue_size, len(queue))
-            
-            if current_puzzle.is_goal():
-                stats = {
-                    'nodes_explored': nodes_explored,
-                    'solution_length': len(path),
-                    'max_queue_size': max_queue_size
-                }
-                return path, stats
             
-            for move in current_puzzle.get_valid_moves():
-                new_puzzle = current_puzzle.copy()
-                new_puzzle.make_move(move)
-                
-                if new_puzzle not in visited:
-                    visited.add(new_puzzle)
-                    queue.append((new_puzzle, path + [move]))
-        
-        return None, {'nodes_explored': nodes_explored, 'solution_length': 0}
+        Raises:
+            SolveCancelled: If `cancel` was set while searching
+        """
+        codes, stats = self._solve_core()
+        return None if codes is None else decode_solution(codes), stats
+
 
+def _solve_one(start_state: int, start_blank: int, size: int) -> Optional[bytes]:
+    """
+    Worker for solve_batch: plain ints in, move codes out (cheap to pickle).
+    Uses BFS for the 8-puzzle and IDA* for larger boards, like the GUI.
+    """
+    if start_state == _goal_state(size):
+        return b''
+    neighbors = _neighbor_table(size)
+    if size == 3:
+        path, _, _ = _bfs_core(start_state, start_blank, _goal_state(size), size, neighbors)
+        return path
+    # Imported here: ida_star_solver itself imports this module
+    from ida_star_solver import _ida_star_core
+    path, _, _ = _ida_star_core(start_state, start_blank, size, neighbors)
+    return path
+
+
+def solve_batch(puzzles: List[Puzzle], max_workers: Optional[int] = None) -> List[Optional[bytes]]:
+    """
+    Solve many independent puzzles in parallel, one process per CPU core.
+    8-puzzles are solved with BFS, 15- and 24-puzzles with IDA*.
+    Handy for benchmarks; results pair up with save_solve_history_many().
+    
+    Args:
+        puzzles: The puzzles to solve
+        max_workers: Number of worker processes (default: all cores)
+        
+    Returns:
+        Move codes for each puzzle in the same order (see decode_solution):
+        b'' for already solved puzzles, None for unsolvable ones
+    """
+    results: List[Optional[bytes]] = [None] * len(puzzles)
+    jobs = []  # (result index, packed state, blank index, size)
+    for i, puzzle in enumerate(puzzles):
+        # Same early checks as a single solve; only real searches are sent out
+        trivial, codes = _trivial_result(puzzle)
+        if trivial:
+            results[i] = codes
+            continue
+        row, col = puzzle.find_empty()
+        jobs.append((i, puzzle.packed(), row * puzzle.size + col, puzzle.size))
+    if not jobs:
+        return results
+    
+    # Imported here: it pulls in multiprocessing, which single solves never need
+    from concurrent.futures import ProcessPoolExecutor
+    
+    workers = max_workers or os.cpu_count() or 1
+    indexes, states, blanks, sizes = zip(*jobs)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        solved = executor.map(_solve_one, states, blanks, sizes,
+                              chunksize=max(1, len(jobs) // (4 * workers)))
+        for i, codes in zip(indexes, solved):
+            results[i] = codes
+    return results
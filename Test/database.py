@@ -14,8 +14,60 @@ Why SQLite?
 
 import sqlite3
 import json
+from contextlib import contextmanager
 from datetime import datetime
-from typing import List, Dict, Optional
+from typing import List, Dict, Iterable, Iterator, Optional, Union
+
+
+# SQL used on every call, kept as module constants so each call passes the
+# exact same string and hits sqlite3's prepared-statement cache
+SQL_INSERT_PUZZLE = '''
+    INSERT INTO saved_puzzles (name, puzzle_state, puzzle_size)
+    VALUES (?, ?, ?)
+'''
+SQL_SELECT_PUZZLE = '''
+    SELECT puzzle_state, puzzle_size FROM saved_puzzles WHERE id = ?
+'''
+SQL_SELECT_ALL_PUZZLES = '''
+    SELECT id, name, puzzle_size AS size, created_at FROM saved_puzzles
+    ORDER BY created_at DESC
+'''
+SQL_INSERT_HISTORY = '''
+    INSERT INTO solve_history (puzzle_state, solution_moves, solve_time, algorithm, solution)
+    VALUES (?, ?, ?, ?, ?)
+'''
+SQL_HISTORY_STATS = '''
+    SELECT COUNT(*), AVG(solution_moves), AVG(solve_time), MIN(solution_moves)
+    FROM solve_history
+'''
+
+
+def _encode_state(puzzle_state: List[List[int]]) -> bytes:
+    """
+    Pack a board into bytes for storage.
+    Tiles up to 15 (3x3, 4x4) fit in 4 bits, so two share a byte;
+    the 24-puzzle uses one byte per tile.
+    """
+    flat = [v for row in puzzle_state for v in row]
+    if len(puzzle_state) <= 4:
+        if len(flat) % 2:
+            flat.append(0)
+        return bytes((flat[i] << 4) | flat[i + 1] for i in range(0, len(flat), 2))
+    return bytes(flat)
+
+
+def _decode_state(stored: Union[bytes, str], size: int) -> List[List[int]]:
+    """Rebuild the 2D board from _encode_state bytes (or a legacy JSON string)."""
+    if isinstance(stored, str):
+        return json.loads(stored)
+    if size <= 4:
+        flat = []
+        for byte in stored:
+            flat.append(byte >> 4)
+            flat.append(byte & 0xF)
+    else:
+        flat = list(stored)
+    return [flat[i * size:(i + 1) * size] for i in range(size)]
 
 
 class PuzzleDatabase:
@@ -32,19 +84,40 @@ class PuzzleDatabase:
             db_name: Name of the database file (SQLite stores in a file)
         """
         self.db_name = db_name
+        
+        # One connection for the app's lifetime (opening one per query is slow)
+        # isolation_level=None: each statement commits on its own unless we BEGIN
+        # cached_statements: keep up to 256 compiled queries around for reuse
+        self._conn = sqlite3.connect(db_name, check_same_thread=False,
+                                     isolation_level=None, cached_statements=256)
+        self._conn.execute('PRAGMA journal_mode=WAL')  # Faster, crash-safe writes
+        self._conn.execute('PRAGMA synchronous=NORMAL')
+        self._conn.execute('PRAGMA temp_store=MEMORY')
+        self._conn.execute('PRAGMA cache_size=-20000')  # ~20 MB page cache
+        # Rows can be read by column name (row['name']) or turned into dicts
+        self._conn.row_factory = sqlite3.Row
+        
         self.init_database()
     
-    def get_connection(self):
-        """Create and return a database connection."""
-        return sqlite3.connect(self.db_name)
+    def shared_connection(self) -> sqlite3.Connection:
+        """
+        Return the database connection shared by every method of this class.
+        
+        The caller does NOT own it: don't close it (use close() when the
+        app exits), or every later query will fail.
+        """
+        return self._conn
+    
+    def close(self):
+        """Close the database connection (call once when the app exits)."""
+        self._conn.close()
     
     def init_database(self):
         """
         Create tables if they don't exist.
         This is like creating folders to organize our data.
         """
-        conn = self.get_connection()
-        cursor = conn.cursor()
+        cursor = self._conn.cursor()
         
         # Table 1: Saved Puzzles
         # Stores puzzle states that users want to save for later
@@ -52,7 +125,7 @@ class PuzzleDatabase:
             CREATE TABLE IF NOT EXISTS saved_puzzles (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
                 name TEXT NOT NULL,
-                puzzle_state TEXT NOT NULL,  -- JSON string of the board
+                puzzle_state BLOB NOT NULL,  -- Packed board (see _encode_state)
                 puzzle_size INTEGER DEFAULT 3,  -- Grid size (3, 4, or 5)
                 created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
             )
@@ -63,16 +136,38 @@ class PuzzleDatabase:
         cursor.execute('''
             CREATE TABLE IF NOT EXISTS solve_history (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
-                puzzle_state TEXT NOT NULL,
+                puzzle_state BLOB NOT NULL,
                 solution_moves INTEGER,  -- Number of moves in solution
                 solve_time REAL,  -- Time taken to solve (seconds)
                 algorithm TEXT DEFAULT 'BFS',  -- Which algorithm was used
+                solution BLOB,  -- The moves themselves, one code per byte
                 solved_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
             )
         ''')
         
-        conn.commit()
-        conn.close()
+        # Databases from older versions may lack the size column
+        cursor.execute('PRAGMA table_info(saved_puzzles)')
+        if 'puzzle_size' not in [column[1] for column in cursor.fetchall()]:
+            cursor.execute('ALTER TABLE saved_puzzles ADD COLUMN puzzle_size INTEGER DEFAULT 3')
+        cursor.execute('PRAGMA table_info(solve_history)')
+        if 'solution' not in [column[1] for column in cursor.fetchall()]:
+            cursor.execute('ALTER TABLE solve_history ADD COLUMN solution BLOB')
+        
+        # Lets MIN(solution_moves) read one index entry instead of the whole table
+        cursor.execute('''
+            CREATE INDEX IF NOT EXISTS idx_history_moves ON solve_history(solution_moves)
+        ''')
+        # Newest-first listings walk these indexes instead of sorting the table.
+        # idx_saved_created also holds every column the saved-puzzle list reads
+        # (id is the rowid), so that query never touches the table itself.
+        cursor.execute('''
+            CREATE INDEX IF NOT EXISTS idx_saved_created
+            ON saved_puzzles(created_at DESC, name, puzzle_size)
+        ''')
+        cursor.execute('''
+            CREATE INDEX IF NOT EXISTS idx_history_solved_at ON solve_history(solved_at DESC)
+        ''')
+        
         print("✅ Database initialized successfully!")
     
     def save_puzzle(self, name: str, puzzle_state: List[List[int]], puzzle_size: int = 3) -> int:
@@ -87,20 +182,14 @@ class PuzzleDatabase:
         Returns:
             The ID of the saved puzzle
         """
-        conn = self.get_connection()
-        cursor = conn.cursor()
+        cursor = self._conn.cursor()
         
-        # Convert the 2D list to JSON string for storage
-        puzzle_json = json.dumps(puzzle_state)
+        # Pack the 2D list into a few bytes for storage
+        puzzle_blob = _encode_state(puzzle_state)
         
-        cursor.execute('''
-            INSERT INTO saved_puzzles (name, puzzle_state, puzzle_size)
-            VALUES (?, ?, ?)
-        ''', (name, puzzle_json, puzzle_size))
+        cursor.execute(SQL_INSERT_PUZZLE, (name, puzzle_blob, puzzle_size))
         
         puzzle_id = cursor.lastrowid
-        conn.commit()
-        conn.close()
         
         return puzzle_id
     
@@ -114,18 +203,14 @@ class PuzzleDatabase:
         Returns:
             The puzzle state as a 2D list, or None if not found
         """
-        conn = self.get_connection()
-        cursor = conn.cursor()
+        cursor = self._conn.cursor()
         
-        cursor.execute('''
-            SELECT puzzle_state FROM saved_puzzles WHERE id = ?
-        ''', (puzzle_id,))
+        cursor.execute(SQL_SELECT_PUZZLE, (puzzle_id,))
         
         result = cursor.fetchone()
-        conn.close()
         
         if result:
-            return json.loads(result[0])
+            return _decode_state(result[0], result[1])
         return None
     
     def get_all_saved_puzzles(self) -> List[Dict]:
@@ -135,29 +220,14 @@ class PuzzleDatabase:
         Returns:
             List of dictionaries with puzzle information
         """
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        
-        cursor.execute('''
-            SELECT id, name, puzzle_size, created_at FROM saved_puzzles
-            ORDER BY created_at DESC
-        ''')
+        cursor = self._conn.cursor()
         
-        puzzles = []
-        for row in cursor.fetchall():
-            puzzles.append({
-                'id': row[0],
-                'name': row[1],
-                'size': row[2],
-                'created_at': row[3]
-            })
-        
-        conn.close()
-        return puzzles
+        # "AS size" gives the dict key the GUI expects, no renaming needed
+        return [dict(row) for row in cursor.execute(SQL_SELECT_ALL_PUZZLES)]
     
     def save_solve_history(self, puzzle_state: List[List[int]], 
                           solution_moves: int, solve_time: float, 
-                          algorithm: str = 'BFS'):
+                          algorithm: str = 'BFS', solution: Optional[bytes] = None):
         """
         Record that a puzzle was solved.
         This helps us track your progress!
@@ -167,19 +237,48 @@ class PuzzleDatabase:
             solution_moves: Number of moves in the solution
             solve_time: Time taken to solve (seconds)
             algorithm: Which algorithm was used
+            solution: Optional move codes (see bfs_solver.encode_solution)
         """
-        conn = self.get_connection()
-        cursor = conn.cursor()
+        cursor = self._conn.cursor()
         
-        puzzle_json = json.dumps(puzzle_state)
+        puzzle_blob = _encode_state(puzzle_state)
         
-        cursor.execute('''
-            INSERT INTO solve_history (puzzle_state, solution_moves, solve_time, algorithm)
-            VALUES (?, ?, ?, ?)
-        ''', (puzzle_json, solution_moves, solve_time, algorithm))
+        cursor.execute(SQL_INSERT_HISTORY,
+                       (puzzle_blob, solution_moves, solve_time, algorithm, solution))
+    
+    @contextmanager
+    def bulk_session(self) -> Iterator[sqlite3.Connection]:
+        """
+        Wrap the shared connection in a single transaction.
+        Everything written inside the `with` block is committed together
+        (one disk sync instead of one per row), or rolled back on error.
         
-        conn.commit()
-        conn.close()
+        Yields:
+            A live database connection
+        """
+        conn = self._conn
+        conn.execute('BEGIN IMMEDIATE')
+        try:
+            yield conn
+            conn.commit()
+        except BaseException:
+            conn.rollback()
+            raise
+    
+    def save_solve_history_many(self, rows: Iterable[tuple]):
+        """
+        Record many solved puzzles at once (e.g. from a benchmark run).
+        
+        Args:
+            rows: Iterable of (puzzle_state, solution_moves, solve_time, algorithm)
+                or (puzzle_state, solution_moves, solve_time, algorithm, solution)
+                tuples; solution is the move codes from solve_batch (or None)
+        """
+        with self.bulk_session() as conn:
+            conn.executemany(SQL_INSERT_HISTORY, (
+                (_encode_state(puzzle_state), solution_moves, solve_time, algorithm,
+                 solution[0] if solution else None)
+                for puzzle_state, solution_moves, solve_time, algorithm, *solution in rows))
     
     def get_solve_statistics(self) -> Dict:
         """
@@ -188,26 +287,14 @@ class PuzzleDatabase:
         Returns:
             Dictionary with statistics
         """
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        
-        # Total puzzles solved
-        cursor.execute('SELECT COUNT(*) FROM solve_history')
-        total_solved = cursor.fetchone()[0]
-        
-        # Average moves
-        cursor.execute('SELECT AVG(solution_moves) FROM solve_history')
-        avg_moves = cursor.fetchone()[0] or 0
-        
-        # Average time
-        cursor.execute('SELECT AVG(solve_time) FROM solve_history')
-        avg_time = cursor.fetchone()[0] or 0
-        
-        # Best (shortest) solution
-        cursor.execute('SELECT MIN(solution_moves) FROM solve_history')
-        best_moves = cursor.fetchone()[0] or 0
+        cursor = self._conn.cursor()
         
-        conn.close()
+        # Count, averages and best solution in a single pass over the table
+        cursor.execute(SQL_HISTORY_STATS)
+        total_solved, avg_moves, avg_time, best_moves = cursor.fetchone()
+        avg_moves = avg_moves or 0
+        avg_time = avg_time or 0
+        best_moves = best_moves or 0
         
         return {
             'total_solved': total_solved,
@@ -18,12 +18,14 @@ tkinter basics:
 """
 
 import tkinter as tk
-from tkinter import ttk, messagebox, simpledialog
+from tkinter import ttk, messagebox, simpledialog, font as tkfont
 import time
-from typing import Optional, List
+from functools import partial
+from typing import Iterable, Optional, List
 from puzzle_logic import Puzzle
-from bfs_solver import BFSSolver
 from database import PuzzleDatabase
+# The solver modules (and concurrent.futures) are imported on the first
+# solve instead, so they don't delay the window appearing
 
 
 class PuzzleGUI:
@@ -32,26 +34,107 @@ class PuzzleGUI:
     Supports 8-puzzle (3x3), 15-puzzle (4x4), and 24-puzzle (5x5).
     """
     
+    MOVE_DESCRIPTIONS = {
+        'up': 'Move tile DOWN into empty space',
+        'down': 'Move tile UP into empty space',
+        'left': 'Move tile RIGHT into empty space',
+        'right': 'Move tile LEFT into empty space'
+    }
+    
+    # Algorithm used for each puzzle size (see _solver_class)
+    ALGORITHMS = {3: 'BFS', 4: 'IDA*', 5: 'IDA*'}
+    
+    # One-line explanation of each algorithm for the solution panel
+    ALGORITHM_SUMMARIES = {
+        'BFS': ("Breadth-First Search explores all\n"
+                "possible moves level by level.\n\n"),
+        'IDA*': ("Iterative Deepening A* searches\n"
+                 "deeper each round, guided by how\n"
+                 "far each tile is from home.\n\n"),
+    }
+    
+    # Help text for each puzzle size (it depends on nothing else)
+    HELP_TEXTS = {
+        size: (f"📚 How to Play:\n"
+               f"• Click tiles to move them\n"
+               f"• Goal: Arrange 1-{size * size - 1} in order\n"
+               f"• {algorithm} finds shortest solution\n"
+               f"• Current: {name}")
+        for size, name, algorithm in ((3, "8-Puzzle (1-8)", ALGORITHMS[3]),
+                                      (4, "15-Puzzle (1-15)", ALGORITHMS[4]),
+                                      (5, "24-Puzzle (1-24)", ALGORITHMS[5]))
+    }
+    
+    # Side length of one tile on the board canvas, per puzzle size
+    TILE_PIXELS = {3: 100, 4: 80, 5: 64}
+    
+    STATS_TEMPLATE = ("📈 Your Statistics:\n"
+                      + "─" * 20 + "\n"
+                      "🎮 Puzzles Solved: {total_solved}\n"
+                      "📊 Avg Moves: {average_moves}\n"
+                      "⏱️  Avg Time: {average_time}s\n"
+                      "🏆 Best: {best}")
+    
     def __init__(self):
         """Initialize the GUI and all components."""
         # Create main window
         self.root = tk.Tk()
-        self.root.title("N-Puzzle Solver - BFS Algorithm")
         self.root.geometry("1000x800")
         self.root.resizable(True, True)
         
+        # Build every font once; passing a Font object skips Tcl re-parsing
+        # a ("Arial", 9, "bold") spec on each config call
+        self.fonts = {
+            'title': tkfont.Font(family="Arial", size=20, weight="bold"),
+            'dialog': tkfont.Font(family="Arial", size=12),
+            'bold10': tkfont.Font(family="Arial", size=10, weight="bold"),
+            'bold9': tkfont.Font(family="Arial", size=9, weight="bold"),
+            'text9': tkfont.Font(family="Arial", size=9),
+            'mono': tkfont.Font(family="Courier", size=9),
+            'mono_bold': tkfont.Font(family="Courier", size=9, weight="bold"),
+            'tile_3': tkfont.Font(family="Arial", size=24, weight="bold"),
+            'tile_4': tkfont.Font(family="Arial", size=18, weight="bold"),
+            'tile_5': tkfont.Font(family="Arial", size=14, weight="bold"),
+        }
+        
         # Puzzle size (3=8-puzzle, 4=15-puzzle, 5=24-puzzle)
         self.puzzle_size = 3
         self.puzzle = Puzzle(size=self.puzzle_size)
         self.db = PuzzleDatabase()
         self.solution_path: Optional[List[str]] = None
-        self.current_solution_step = 0
-        self.tile_buttons = []  # Will be created dynamically
+        # Current step of the solution; every write moves the highlight
+        self.current_step_var = tk.IntVar(value=0)
+        self.current_step_var.trace_add("write", lambda *args: self._schedule_redraw(()))
+        self._rendered_path = None  # The solution_path the text widget shows
+        self.step_line_ranges = []  # (step line, description line) per move
+        self._highlighted_step = 0
+        self._footer_line = 0
+        self.tile_pool = []  # Canvas (rectangle, text) ids, created once
+        self.tile_items = []  # The part of tile_pool the current size uses
+        self.tile_state = []  # Last (text, bg) shown on each cell, by flat index
+        self._pending_redraw = False  # An after_idle redraw is already queued
+        self._dirty_cells = set()  # Cells it must redraw (None: whole board)
+        self._help_size = None  # Puzzle size the help text was written for
+        self._stats_cache: Optional[dict] = None  # Cleared whenever a solve is recorded
+        
+        # Background solving: one worker thread (started on first solve),
+        # polled from the Tk loop
+        self._executor = None
+        self._solving = False  # True while a solve is running (blocks a second one)
+        self._solver = None
+        self._solver_future = None
+        self._solver_algorithm = 'BFS'
+        self._solving_board = None
+        self._solution_start = None  # Board the current solution_path starts from
+        self._autoplay_jobs = []  # Pending root.after ids of an auto-play
+        self._solving_label = ""
+        self._poll_frame = 0
         
         # Create GUI components
         self.create_widgets()
         
         # Update display
+        self.update_algorithm_labels()
         self.update_display()
     
     def create_widgets(self):
@@ -65,14 +148,14 @@ class PuzzleGUI:
         
         # Title
         title_label = ttk.Label(main_frame, text="N-Puzzle Solver", 
-                               font=("Arial", 20, "bold"))
+                               font=self.fonts['title'])
         title_label.grid(row=0, column=0, columnspan=3, pady=10)
         
         # Puzzle size selector
         size_frame = ttk.Frame(main_frame)
         size_frame.grid(row=1, column=0, columnspan=3, pady=5)
         
-        ttk.Label(size_frame, text="Puzzle Size:", font=("Arial", 10, "bold")).pack(side=tk.LEFT, padx=5)
+        ttk.Label(size_frame, text="Puzzle Size:", font=self.fonts['bold10']).pack(side=tk.LEFT, padx=5)
         self.size_var = tk.IntVar(value=3)
         
         size_options = [
@@ -89,7 +172,7 @@ class PuzzleGUI:
         self.board_frame = ttk.LabelFrame(main_frame, text="Puzzle Board", padding="10")
         self.board_frame.grid(row=2, column=0, columnspan=2, padx=10, pady=10, sticky=(tk.W, tk.E))
         
-        # Create puzzle board (will be updated when size changes)
+        # Create puzzle board (rearranged when size changes)
         self.create_puzzle_board()
         
         # Control buttons frame
@@ -103,8 +186,12 @@ class PuzzleGUI:
         generate_btn.config(width=20)  # Make it more prominent
         
         ttk.Button(controls_frame, text="Shuffle", command=self.shuffle_puzzle).grid(row=0, column=1, padx=5, pady=5)
-        ttk.Button(controls_frame, text="Solve (BFS)", command=self.solve_puzzle).grid(row=0, column=2, padx=5, pady=5)
+        self.solve_button = ttk.Button(controls_frame, text=self._solve_label(), command=self.solve_puzzle)
+        self.solve_button.grid(row=0, column=2, padx=5, pady=5)
         ttk.Button(controls_frame, text="Reset", command=self.reset_puzzle).grid(row=0, column=3, padx=5, pady=5)
+        self.cancel_button = ttk.Button(controls_frame, text="Cancel", command=self.cancel_solve,
+                                        state=tk.DISABLED)
+        self.cancel_button.grid(row=0, column=4, padx=5, pady=5)
         
         # Button row 2 - Solution controls
         ttk.Button(controls_frame, text="Step Solution", command=self.step_solution).grid(row=1, column=0, padx=5, pady=5)
@@ -118,18 +205,17 @@ class PuzzleGUI:
         
         # Instructions/Help text at the top
         self.help_text = tk.Text(info_frame, width=30, height=5, wrap=tk.WORD, 
-                           font=("Arial", 9), bg="lightyellow", relief=tk.FLAT)
+                           font=self.fonts['text9'], bg="lightyellow", relief=tk.FLAT)
         self.update_help_text()
         self.help_text.config(state=tk.DISABLED)  # Make it read-only
         self.help_text.grid(row=0, column=0, columnspan=2, pady=5, sticky=(tk.W, tk.E))
         
         # Solution display with label
-        solution_label = ttk.Label(info_frame, text="Solution Path (BFS Algorithm):", 
-                                   font=("Arial", 10, "bold"))
-        solution_label.grid(row=1, column=0, columnspan=2, sticky=tk.W, pady=(10, 5))
+        self.solution_label = ttk.Label(info_frame, font=self.fonts['bold10'])
+        self.solution_label.grid(row=1, column=0, columnspan=2, sticky=tk.W, pady=(10, 5))
         
         self.solution_text = tk.Text(info_frame, width=30, height=12, wrap=tk.WORD,
-                                     font=("Courier", 9))
+                                     font=self.fonts['mono'])
         self.solution_text.grid(row=2, column=0, pady=5, sticky=(tk.W, tk.E, tk.N, tk.S))
         scrollbar = ttk.Scrollbar(info_frame, orient=tk.VERTICAL, command=self.solution_text.yview)
         scrollbar.grid(row=2, column=1, sticky=(tk.N, tk.S))
@@ -139,7 +225,7 @@ class PuzzleGUI:
         stats_frame = ttk.LabelFrame(info_frame, text="📊 Your Progress", padding="5")
         stats_frame.grid(row=3, column=0, columnspan=2, pady=5, sticky=(tk.W, tk.E))
         
-        self.stats_label = ttk.Label(stats_frame, text="", font=("Arial", 9))
+        self.stats_label = ttk.Label(stats_frame, text="", font=self.fonts['text9'])
         self.stats_label.grid(row=0, column=0, sticky=tk.W)
         
         # Status bar
@@ -150,53 +236,73 @@ class PuzzleGUI:
         self.update_statistics()
     
     def update_help_text(self):
-        """Update help text based on current puzzle size."""
-        puzzle_names = {3: "8-Puzzle (1-8)", 4: "15-Puzzle (1-15)", 5: "24-Puzzle (1-24)"}
-        max_tile = self.puzzle_size * self.puzzle_size - 1
+        """Update help text based on current puzzle size (only if it changed)."""
+        if self._help_size == self.puzzle_size:
+            return
+        self._help_size = self.puzzle_size
         self.help_text.config(state=tk.NORMAL)
         self.help_text.delete(1.0, tk.END)
-        self.help_text.insert(1.0, f"📚 How to Play:\n"
-                              f"• Click tiles to move them\n"
-                              f"• Goal: Arrange 1-{max_tile} in order\n"
-                              f"• BFS finds shortest solution\n"
-                              f"• Current: {puzzle_names[self.puzzle_size]}")
+        self.help_text.insert(1.0, self.HELP_TEXTS[self.puzzle_size])
         self.help_text.config(state=tk.DISABLED)
     
     def create_puzzle_board(self):
         """
-        Create the puzzle board with buttons based on current size.
+        Create the puzzle board.
+        The whole board is one Canvas: each tile is a rectangle plus a text
+        item, and a single click handler works out which tile was hit.
+        Items for the largest (5x5) board are created once and reused for
+        every size, so switching sizes never creates or destroys anything.
+        """
+        self.board_canvas = tk.Canvas(self.board_frame, highlightthickness=0)
+        self.board_canvas.grid(row=0, column=0)
+        self.board_canvas.bind("<Button-1>", self.on_board_click)
+        
+        # (rectangle id, text id) pairs, enough for the largest board
+        max_cells = max(self.TILE_PIXELS) ** 2
+        self.tile_pool = [(self.board_canvas.create_rectangle(0, 0, 0, 0, outline="gray"),
+                           self.board_canvas.create_text(0, 0))
+                          for _ in range(max_cells)]
+        self.layout_puzzle_board()
+    
+    def layout_puzzle_board(self):
+        """
+        Arrange the pooled tile items for the current puzzle size.
+        Cells the current size doesn't use are hidden, not deleted.
         This is called when the puzzle size changes.
         """
-        # Clear existing buttons
-        for widget in self.board_frame.winfo_children():
-            widget.destroy()
-        
-        self.tile_buttons = []
         size = self.puzzle_size
-        
-        # Adjust button size based on puzzle size
-        if size == 3:
-            btn_width, btn_height, font_size = 8, 4, 24
-        elif size == 4:
-            btn_width, btn_height, font_size = 6, 3, 18
-        else:  # size == 5
-            btn_width, btn_height, font_size = 5, 2, 14
-        
-        # Create grid of buttons
-        for i in range(size):
-            row = []
-            for j in range(size):
-                btn = tk.Button(self.board_frame, text="", 
-                              width=btn_width, height=btn_height,
-                              font=("Arial", font_size, "bold"),
-                              command=lambda r=i, c=j: self.on_tile_click(r, c))
-                btn.grid(row=i, column=j, padx=1, pady=1)
-                row.append(btn)
-            self.tile_buttons.append(row)
+        tile = self.TILE_PIXELS[size]
+        tile_font = self.fonts[f'tile_{size}']
+        canvas = self.board_canvas
+        canvas.config(width=size * tile, height=size * tile)
+        
+        # Nothing has been drawn at this size yet, so every tile counts as changed
+        self.tile_state = [(None, None)] * (size * size)
+        # (rectangle id, text id) for every cell, by flat index
+        self.tile_items = self.tile_pool[:size * size]
+        
+        for idx, (rect, text) in enumerate(self.tile_pool):
+            if idx < size * size:
+                i, j = divmod(idx, size)
+                x, y = j * tile, i * tile
+                canvas.coords(rect, x + 1, y + 1, x + tile - 1, y + tile - 1)
+                canvas.coords(text, x + tile // 2, y + tile // 2)
+                canvas.itemconfig(rect, state=tk.NORMAL)
+                canvas.itemconfig(text, state=tk.NORMAL, font=tile_font)
+            else:
+                canvas.itemconfig(rect, state=tk.HIDDEN)
+                canvas.itemconfig(text, state=tk.HIDDEN)
+    
+    def on_board_click(self, event):
+        """Translate a click on the board canvas into a (row, col) tile click."""
+        tile = self.TILE_PIXELS[self.puzzle_size]
+        row, col = event.y // tile, event.x // tile
+        if 0 <= row < self.puzzle_size and 0 <= col < self.puzzle_size:
+            self.on_tile_click(row, col)
     
     def change_puzzle_size(self):
         """
-        Change the puzzle size and recreate the board.
+        Change the puzzle size and rearrange the board.
         This is called when user selects a different size.
         """
         new_size = self.size_var.get()
@@ -212,37 +318,87 @@ class PuzzleGUI:
         
         self.puzzle_size = new_size
         self.puzzle = Puzzle(size=self.puzzle_size)
-        self.solution_path = None
-        self.current_solution_step = 0
         
-        # Recreate board
-        self.create_puzzle_board()
-        self.update_display()
-        self.update_solution_display()
+        # Rearrange the board for the new size
+        self.layout_puzzle_board()
+        self._schedule_redraw()
+        self._invalidate_solution()
         self.update_help_text()
         
-        # Update window title
+        # Window title and solver labels follow the new size
+        self.update_algorithm_labels()
         puzzle_names = {3: "8-Puzzle", 4: "15-Puzzle", 5: "24-Puzzle"}
-        self.root.title(f"{puzzle_names[self.puzzle_size]} Solver - BFS Algorithm")
         self.status_label.config(text=f"Switched to {puzzle_names[self.puzzle_size]}")
     
     def update_display(self):
         """
         Update the puzzle board display to match current state.
         This is called whenever the puzzle state changes.
+        Only tiles whose text or color actually changed are reconfigured
+        (a single slide touches just 2 of them).
+        """
+        self.update_cells(range(self.puzzle_size * self.puzzle_size))
+    
+    def update_cells(self, indices: Iterable[int]):
+        """
+        Redraw only the given cells of the board.
+        
+        Args:
+            indices: Flat cell indices (row * size + col)
         """
+        cells = self.puzzle.cells
+        for idx in indices:
+            value = cells[idx]
+            
+            if value == 0:
+                # Empty space - make it invisible
+                new = ("", "lightgray")
+            else:
+                # Show the number
+                new = (str(value), "lightblue")
+            
+            if self.tile_state[idx] != new:
+                rect, text = self.tile_items[idx]
+                self.board_canvas.itemconfig(rect, fill=new[1])
+                self.board_canvas.itemconfig(text, text=new[0])
+                self.tile_state[idx] = new
+    
+    def _play_move(self, move: str):
+        """Make one move and queue a redraw of just the two cells it swapped."""
         size = self.puzzle_size
-        for i in range(size):
-            for j in range(size):
-                value = self.puzzle.state[i][j]
-                btn = self.tile_buttons[i][j]
-                
-                if value == 0:
-                    # Empty space - make it invisible
-                    btn.config(text="", bg="lightgray", state=tk.NORMAL)
-                else:
-                    # Show the number
-                    btn.config(text=str(value), bg="lightblue", state=tk.NORMAL)
+        row, col = self.puzzle.empty_pos
+        if self.puzzle.make_move(move):
+            new_row, new_col = self.puzzle.empty_pos
+            self._schedule_redraw((row * size + col, new_row * size + new_col))
+    
+    def _schedule_redraw(self, cells: Optional[Iterable[int]] = None):
+        """
+        Queue a redraw of the board and the solution highlight for the next
+        time Tk is idle. A burst of changes (fast step clicks, a move plus a
+        step change) is collapsed into a single redraw pass.
+        
+        Args:
+            cells: Flat indices of the cells that changed, or None to check
+                the whole board
+        """
+        if cells is None:
+            self._dirty_cells = None
+        elif self._dirty_cells is not None:
+            self._dirty_cells.update(cells)
+        
+        if not self._pending_redraw:
+            self._pending_redraw = True
+            self.root.after_idle(self._do_redraw)
+    
+    def _do_redraw(self):
+        """Run the redraw queued by _schedule_redraw."""
+        cells, self._dirty_cells = self._dirty_cells, set()
+        self._pending_redraw = False
+        if cells is None:
+            self.update_display()
+        else:
+            self.update_cells(cells)
+        self.advance_solution_highlight()
     
     def on_tile_click(self, row: int, col: int):
         """
@@ -253,7 +409,7 @@ class PuzzleGUI:
             row: Row of clicked tile
             col: Column of clicked tile
         """
-        empty_row, empty_col = self.puzzle.find_empty()
+        empty_row, empty_col = self.puzzle.empty_pos
         
         # Check if clicked tile is adjacent to empty space
         if (row == empty_row and abs(col - empty_col) == 1) or \
@@ -270,14 +426,11 @@ class PuzzleGUI:
                 direction = 'right'
             
             # Make the move
-            self.puzzle.make_move(direction)
-            self.update_display()
+            self._play_move(direction)
             self.check_win()
             
             # Clear solution if user manually moves
-            self.solution_path = None
-            self.current_solution_step = 0
-            self.update_solution_display()
+            self._invalidate_solution()
     
     def generate_new_puzzle(self):
         """
@@ -285,55 +438,128 @@ class PuzzleGUI:
         This is the main entry point for starting a new game!
         """
         self.puzzle.shuffle(100)
-        self.update_display()
-        self.solution_path = None
-        self.current_solution_step = 0
-        self.update_solution_display()
-        self.status_label.config(text="✨ New puzzle generated! Try to solve it or click 'Solve (BFS)' to see the solution.")
+        self._schedule_redraw()
+        self._invalidate_solution()
+        self.status_label.config(text=f"✨ New puzzle generated! Try to solve it or click '{self._solve_label()}' to see the solution.")
     
     def shuffle_puzzle(self):
         """Shuffle the puzzle randomly."""
         self.puzzle.shuffle(100)
-        self.update_display()
-        self.solution_path = None
-        self.current_solution_step = 0
-        self.update_solution_display()
+        self._schedule_redraw()
+        self._invalidate_solution()
         self.status_label.config(text="Puzzle shuffled!")
     
     def reset_puzzle(self):
         """Reset puzzle to goal state."""
         self.puzzle = Puzzle(size=self.puzzle_size)
-        self.update_display()
-        self.solution_path = None
-        self.current_solution_step = 0
-        self.update_solution_display()
+        self._schedule_redraw()
+        self._invalidate_solution()
         puzzle_names = {3: "8-Puzzle", 4: "15-Puzzle", 5: "24-Puzzle"}
         self.status_label.config(text=f"{puzzle_names[self.puzzle_size]} reset to goal state")
     
     def solve_puzzle(self):
         """
-        Solve the puzzle using BFS algorithm.
+        Solve the puzzle using BFS (8-puzzle) or IDA* (15- and 24-puzzle).
         This is where the magic happens!
         Note: Larger puzzles (4x4, 5x5) may take significantly longer to solve!
         """
+        # Only one search at a time
+        if self._solving:
+            return
+        
         puzzle_names = {3: "8-Puzzle", 4: "15-Puzzle", 5: "24-Puzzle"}
         puzzle_name = puzzle_names.get(self.puzzle_size, "Puzzle")
         
-        if self.puzzle_size >= 4:
+        solver_class, algorithm = self._solver_class()
+        
+        if self.puzzle_size >= 5:
             if not messagebox.askyesno("Warning", 
-                                      f"Solving {puzzle_name} with BFS may take a long time "
+                                      f"Solving {puzzle_name} with {algorithm} may take a long time "
                                       f"(could be several minutes or more).\n\n"
                                       f"Continue anyway?"):
                 return
         
-        self.status_label.config(text=f"Solving {puzzle_name} with BFS... Please wait (this may take a while).")
-        self.root.update()  # Update GUI to show status
+        # Search on a worker thread so the window keeps responding
+        if self._executor is None:
+            from concurrent.futures import ThreadPoolExecutor
+            self._executor = ThreadPoolExecutor(max_workers=1)
+        self._solver = solver_class(self.puzzle)
+        self._solving_board = self.puzzle.state  # A snapshot, not a live view
+        self._solving_label = f"Solving {puzzle_name} with {algorithm}"
+        self._solver_future = self._executor.submit(self._timed_solve, self._solver)
+        self._solver_algorithm = algorithm
+        self._poll_frame = 0
+        self._solving = True
+        self.solve_button.config(state=tk.DISABLED)
+        self.cancel_button.config(state=tk.NORMAL)
+        self._poll_solver()
+    
+    def _solver_class(self) -> tuple:
+        """
+        Pick the solver for the current size, importing it on first use.
         
+        Returns:
+            Tuple of (solver class, algorithm name)
+        """
+        # BFS runs out of memory beyond 3x3; IDA* only keeps the current path
+        algorithm = self.ALGORITHMS[self.puzzle_size]
+        if algorithm == 'BFS':
+            from bfs_solver import BFSSolver
+            return BFSSolver, algorithm
+        from ida_star_solver import IDAStarSolver
+        return IDAStarSolver, algorithm
+    
+    def _solve_label(self) -> str:
+        """Text of the solve button, naming the algorithm for the current size."""
+        return f"Solve ({self.ALGORITHMS[self.puzzle_size]})"
+    
+    def update_algorithm_labels(self):
+        """Show the current size's algorithm in the title, solve button and solution label."""
+        algorithm = self.ALGORITHMS[self.puzzle_size]
+        puzzle_names = {3: "8-Puzzle", 4: "15-Puzzle", 5: "24-Puzzle"}
+        self.root.title(f"{puzzle_names[self.puzzle_size]} Solver - {algorithm} Algorithm")
+        self.solve_button.config(text=self._solve_label())
+        self.solution_label.config(text=f"Solution Path ({algorithm} Algorithm):")
+    
+    @staticmethod
+    def _timed_solve(solver) -> tuple:
+        """Runs on the worker thread: solve and time the search."""
         start_time = time.time()
-        solver = BFSSolver(self.puzzle)
-        self.solution_path, stats = solver.solve_with_stats()
-        solve_time = time.time() - start_time
+        path, stats = solver.solve_with_stats()
+        return path, stats, time.time() - start_time
+    
+    def _poll_solver(self):
+        """
+        Check on the background solve every 50ms.
+        While it runs the status bar shows a small progress animation;
+        once it finishes, the result is shown and recorded.
+        """
+        future = self._solver_future
+        if not future.done():
+            dots = "." * (self._poll_frame % 3 + 1)
+            self.status_label.config(text=f"{self._solving_label}{dots:<3} (click Cancel to stop)")
+            self._poll_frame += 1
+            self.root.after(50, self._poll_solver)
+            return
+        
+        from bfs_solver import SolveCancelled, encode_solution  # Already loaded by now
+        self._solver_future = None
+        self._solving = False
+        self.solve_button.config(state=tk.NORMAL)
+        self.cancel_button.config(state=tk.DISABLED)
+        try:
+            solution_path, stats, solve_time = future.result()
+        except SolveCancelled:
+            self.status_label.config(text="Solve cancelled")
+            return
         
+        # The board may have been changed while the solver was busy
+        if self.puzzle.state != self._solving_board:
+            self.status_label.config(text="Puzzle changed while solving - click Solve again")
+            return
+        
+        self.solution_path = solution_path
+        self._solution_start = self._solving_board
         if self.solution_path is None:
             messagebox.showerror("Error", "Puzzle is not solvable!")
             self.status_label.config(text="Error: Puzzle not solvable")
@@ -341,15 +567,17 @@ class PuzzleGUI:
         
         # Save to database
         self.db.save_solve_history(
-            self.puzzle.state,
+            self._solving_board,
             len(self.solution_path),
             solve_time,
-            'BFS'
+            self._solver_algorithm,
+            encode_solution(self.solution_path)
         )
+        self._stats_cache = None  # History changed; re-query on next update
         
         # Update display
-        self.current_solution_step = 0
-        self.update_solution_display()
+        self.current_step_var.set(0)
+        self.render_solution_full()
         self.update_statistics()
         
         self.status_label.config(
@@ -357,18 +585,22 @@ class PuzzleGUI:
                  f"Explored {stats['nodes_explored']} states in {solve_time:.2f}s"
         )
     
+    def cancel_solve(self):
+        """Ask the running solver to stop (it checks the flag as it searches)."""
+        if self._solver_future is not None:
+            self._solver.cancel = True
+            self.status_label.config(text="Cancelling...")
+    
     def step_solution(self):
         """Execute one step of the solution."""
         if self.solution_path is None:
-            messagebox.showinfo("Info", "No solution available. Click 'Solve (BFS)' first.")
+            messagebox.showinfo("Info", f"No solution available. Click '{self._solve_label()}' first.")
             return
         
-        if self.current_solution_step < len(self.solution_path):
-            move = self.solution_path[self.current_solution_step]
-            self.puzzle.make_move(move)
-            self.current_solution_step += 1
-            self.update_display()
-            self.update_solution_display()
+        step = self.current_step_var.get()
+        if step < len(self.solution_path):
+            self._play_move(self.solution_path[step])
+            self.current_step_var.set(step + 1)
             self.check_win()
         else:
             messagebox.showinfo("Info", "Solution complete!")
@@ -376,114 +608,168 @@ class PuzzleGUI:
     def auto_play_solution(self):
         """
         Automatically play through the solution with animation.
-        This is a great way to see BFS in action!
+        This is a great way to see the solver in action!
         """
         if self.solution_path is None:
-            messagebox.showinfo("Info", "No solution available. Click 'Solve (BFS)' first.")
+            messagebox.showinfo("Info", f"No solution available. Click '{self._solve_label()}' first.")
             return
         
-        # Reset to initial state
-        self.reset_puzzle()
-        self.solve_puzzle()  # Re-solve to get solution
-        
-        def play_next_step():
-            if self.current_solution_step < len(self.solution_path):
-                move = self.solution_path[self.current_solution_step]
-                self.puzzle.make_move(move)
-                self.current_solution_step += 1
-                self.update_display()
-                self.update_solution_display()
-                # Schedule next step after 500ms (creates animation effect)
-                self.root.after(500, play_next_step)
-            else:
-                self.status_label.config(text="Auto-play complete!")
-                messagebox.showinfo("Success", "Puzzle solved!")
-        
-        play_next_step()
+        # Rewind to the board the solution was found for - no need to solve
+        # again, the path we already have still applies
+        for job in self._autoplay_jobs:
+            self.root.after_cancel(job)
+        self.puzzle = Puzzle(size=self.puzzle_size, state=self._solution_start)
+        self._schedule_redraw()
+        self.current_step_var.set(0)
+        
+        # Schedule every frame up front; the Tk event loop fires them 500ms
+        # apart (animation effect)
+        path = self.solution_path
+        self._autoplay_jobs = [self.root.after(500 * (step + 1), partial(self._apply_step, path, step))
+                               for step in range(len(path))]
+        self._autoplay_jobs.append(
+            self.root.after(500 * (len(path) + 1), partial(self._finish_auto_play, path)))
     
-    def update_solution_display(self):
+    def _apply_step(self, path: List[str], step: int):
         """
-        Update the solution text display with detailed explanations.
-        This helps users understand what BFS is doing!
+        Play one scheduled auto-play frame.
+        Frames left over from an old solution (or after the user moved a
+        tile) no longer line up with the board and are skipped.
+        """
+        if self.solution_path is not path or self.current_step_var.get() != step:
+            return
+        self._play_move(path[step])
+        self.current_step_var.set(step + 1)
+    
+    def _finish_auto_play(self, path: List[str]):
+        """Last scheduled auto-play frame: announce the result."""
+        if self.solution_path is not path or self.current_step_var.get() != len(path):
+            return
+        self.status_label.config(text="Auto-play complete!")
+        messagebox.showinfo("Success", "Puzzle solved!")
+    
+    def _invalidate_solution(self):
+        """
+        Forget the current solution after the board changed some other way
+        (shuffle, reset, manual move, load, size change) and redraw the panel.
+        """
+        self.solution_path = None
+        self.current_step_var.set(0)
+        self.render_solution_full()
+    
+    def render_solution_full(self):
+        """
+        Rebuild the solution text display with detailed explanations.
+        This helps users understand what the solver is doing!
+        Called when the solution itself changes; stepping through an existing
+        solution only moves the highlight (see advance_solution_highlight).
         """
         self.solution_text.delete(1.0, tk.END)
         
+        # Text.insert takes alternating (text, tags) pairs, so each panel goes
+        # in with one call and every styled line carries its tag with it
+        # (no hard-coded line numbers to keep in sync with the text)
         if self.solution_path is None:
             # No solution yet - provide helpful information
-            self.solution_text.insert(tk.END, "🔍 BFS Algorithm Solution\n")
-            self.solution_text.insert(tk.END, "=" * 28 + "\n\n")
-            self.solution_text.insert(tk.END, "No solution calculated yet.\n\n")
-            self.solution_text.insert(tk.END, "📌 What is BFS?\n")
-            self.solution_text.insert(tk.END, "Breadth-First Search explores all\n")
-            self.solution_text.insert(tk.END, "possible moves level by level.\n\n")
-            self.solution_text.insert(tk.END, "✨ Key Features:\n")
-            self.solution_text.insert(tk.END, "• Finds SHORTEST solution\n")
-            self.solution_text.insert(tk.END, "• Guarantees optimal path\n")
-            self.solution_text.insert(tk.END, "• Explores systematically\n\n")
-            self.solution_text.insert(tk.END, "🚀 Click 'Solve (BFS)' to\n")
-            self.solution_text.insert(tk.END, "find the solution!")
-            
-            # Style the text
-            self.solution_text.tag_add("title", "1.0", "1.28")
-            self.solution_text.tag_config("title", font=("Arial", 10, "bold"))
-            self.solution_text.tag_add("subtitle", "4.0", "4.15")
-            self.solution_text.tag_config("subtitle", font=("Arial", 9, "bold"))
-            self.solution_text.tag_add("subtitle2", "8.0", "8.15")
-            self.solution_text.tag_config("subtitle2", font=("Arial", 9, "bold"))
+            self.solution_text.tag_config("title", font=self.fonts['bold10'])
+            self.solution_text.tag_config("subtitle", font=self.fonts['bold9'])
+            algorithm = self.ALGORITHMS[self.puzzle_size]
+            self.solution_text.insert(tk.END,
+                f"🔍 {algorithm} Algorithm Solution\n", "title",
+                "=" * 28 + "\n\n"
+                "No solution calculated yet.\n\n", (),
+                f"📌 What is {algorithm}?\n", "subtitle",
+                self.ALGORITHM_SUMMARIES[algorithm], (),
+                "✨ Key Features:\n", "subtitle",
+                "• Finds SHORTEST solution\n"
+                "• Guarantees optimal path\n"
+                "• Explores systematically\n\n"
+                f"🚀 Click '{self._solve_label()}' to\n"
+                "find the solution!", ())
         else:
             # Solution found - show it with explanations
-            self.solution_text.insert(tk.END, "✅ BFS Solution Found!\n")
-            self.solution_text.insert(tk.END, "=" * 28 + "\n\n")
-            self.solution_text.insert(tk.END, f"📊 Total Moves: {len(self.solution_path)}\n")
-            self.solution_text.insert(tk.END, f"🎯 This is the SHORTEST path!\n\n")
-            self.solution_text.insert(tk.END, "📋 Move Sequence:\n")
-            self.solution_text.insert(tk.END, "-" * 28 + "\n")
+            self.solution_text.tag_config("header", font=self.fonts['bold10'], foreground="green")
+            self.solution_text.tag_config("stats", font=self.fonts['bold9'])
+            self.solution_text.tag_config("section", font=self.fonts['bold9'])
+            chunks = [
+                f"✅ {self._solver_algorithm} Solution Found!\n", "header",
+                "=" * 28 + "\n\n", (),
+                f"📊 Total Moves: {len(self.solution_path)}\n"
+                "🎯 This is the SHORTEST path!\n", "stats",
+                "\n", (),
+                "📋 Move Sequence:\n", "section",
+                "-" * 28 + "\n", (),
+            ]
             
+            # Each step gets its own line followed by a description line.
+            # Descriptions are hidden (elided) except for the current step,
+            # so line numbers never change while stepping. Lines are counted
+            # while the text is built, so each step's position is known
+            # without searching the widget.
+            self.solution_text.tag_config("hidden", elide=True)
+            first_line = sum(text.count("\n") for text in chunks[::2]) + 1
+            self.step_line_ranges = []
             for i, move in enumerate(self.solution_path):
-                marker = "→ " if i == self.current_solution_step else "  "
-                move_desc = {
-                    'up': 'Move tile DOWN into empty space',
-                    'down': 'Move tile UP into empty space',
-                    'left': 'Move tile RIGHT into empty space',
-                    'right': 'Move tile LEFT into empty space'
-                }
-                self.solution_text.insert(tk.END, f"{marker}Step {i+1}: {move.upper()}\n")
-                if i == self.current_solution_step:
-                    self.solution_text.insert(tk.END, f"   ({move_desc[move]})\n")
+                line = first_line + 2 * i
+                self.step_line_ranges.append((f"{line}.0", f"{line + 1}.0"))
+                chunks += [f"  Step {i+1}: {move.upper()}\n", (),
+                           f"   ({self.MOVE_DESCRIPTIONS[move]})\n", "hidden"]
             
-            self.solution_text.insert(tk.END, "\n")
-            if self.current_solution_step >= len(self.solution_path):
-                self.solution_text.insert(tk.END, "🎉 Solution Complete!\n")
-                self.solution_text.insert(tk.END, "Puzzle is now solved!")
-            else:
-                self.solution_text.insert(tk.END, f"📍 Progress: {self.current_solution_step}/{len(self.solution_path)} moves\n")
-                self.solution_text.insert(tk.END, "Use 'Step Solution' to execute moves")
-            
-            # Style the text with colors and formatting
-            self.solution_text.tag_add("header", "1.0", "1.end")
-            self.solution_text.tag_config("header", font=("Arial", 10, "bold"), foreground="green")
-            self.solution_text.tag_add("stats", "3.0", "4.0")
-            self.solution_text.tag_config("stats", font=("Arial", 9, "bold"))
-            self.solution_text.tag_add("section", "6.0", "6.end")
-            self.solution_text.tag_config("section", font=("Arial", 9, "bold"))
-            
-            # Highlight current step - find the line dynamically
-            content = self.solution_text.get(1.0, tk.END)
-            lines = content.split('\n')
-            current_line_num = None
+            self._footer_line = first_line + 2 * len(self.solution_path) + 1
+            chunks += ["\n" + self._solution_footer(), ()]
+            self.solution_text.insert(tk.END, *chunks)
             
-            # Find the line with the current step marker
-            for i, line in enumerate(lines):
-                if f"→ Step {self.current_solution_step + 1}:" in line:
-                    current_line_num = i + 1
-                    break
-            
-            # Highlight current step if found
-            if current_line_num:
-                start_pos = f"{current_line_num}.0"
-                end_pos = f"{current_line_num + 1}.0"
-                self.solution_text.tag_add("current", start_pos, end_pos)
-                self.solution_text.tag_config("current", background="yellow", font=("Courier", 9, "bold"))
+            # Highlight current step
+            self.solution_text.tag_config("current", background="yellow", font=self.fonts['mono_bold'])
+            self._highlighted_step = self.current_step_var.get()
+            self._set_step_marker(self._highlighted_step, True)
+        self._rendered_path = self.solution_path
+    
+    def advance_solution_highlight(self):
+        """
+        Move the "current step" highlight to current_step_var.
+        Runs automatically whenever current_step_var is written.
+        Only the old and new step lines and the progress footer are edited,
+        instead of rebuilding the whole move list.
+        """
+        step = self.current_step_var.get()
+        # Nothing to move if there's no solution, or the text on screen is
+        # for an older one (render_solution_full will draw it fresh)
+        if (self.solution_path is None or self._rendered_path is not self.solution_path
+                or self._highlighted_step == step):
+            return
+        
+        self._set_step_marker(self._highlighted_step, False)
+        self._set_step_marker(step, True)
+        self._highlighted_step = step
+        
+        self.solution_text.delete(f"{self._footer_line}.0", tk.END)
+        self.solution_text.insert(tk.END, self._solution_footer())
+    
+    def _set_step_marker(self, step: int, active: bool):
+        """Show or clear the arrow, highlight and description of one step."""
+        if step >= len(self.solution_path):
+            return  # Past the last move: nothing to mark
+        
+        start, end = self.step_line_ranges[step]
+        # Same-length swap ("→ " / "  "), so no line moves
+        self.solution_text.delete(start, f"{start}+2c")
+        self.solution_text.insert(start, "→ " if active else "  ")
+        description = (end, f"{end}+1l")
+        if active:
+            self.solution_text.tag_add("current", start, end)
+            self.solution_text.tag_remove("hidden", *description)
+        else:
+            self.solution_text.tag_remove("current", start, end)
+            self.solution_text.tag_add("hidden", *description)
+    
+    def _solution_footer(self) -> str:
+        """Progress text shown below the move list."""
+        step = self.current_step_var.get()
+        if step >= len(self.solution_path):
+            return "🎉 Solution Complete!\nPuzzle is now solved!"
+        return (f"📍 Progress: {step}/{len(self.solution_path)} moves\n"
+                "Use 'Step Solution' to execute moves")
     
     def check_win(self):
         """Check if puzzle is solved and show message."""
@@ -512,7 +798,7 @@ class PuzzleGUI:
         dialog.title("Load Puzzle")
         dialog.geometry("400x300")
         
-        ttk.Label(dialog, text="Select a puzzle to load:", font=("Arial", 12)).pack(pady=10)
+        ttk.Label(dialog, text="Select a puzzle to load:", font=self.fonts['dialog']).pack(pady=10)
         
         listbox = tk.Listbox(dialog, height=10)
         listbox.pack(pady=10, padx=20, fill=tk.BOTH, expand=True)
@@ -533,34 +819,40 @@ class PuzzleGUI:
                     if loaded_size != self.puzzle_size:
                         self.size_var.set(loaded_size)
                         self.puzzle_size = loaded_size
-                        self.create_puzzle_board()
+                        self.layout_puzzle_board()
                         self.update_help_text()
                     
                     self.puzzle = Puzzle(size=self.puzzle_size, state=puzzle_state)
-                    self.update_display()
-                    self.solution_path = None
-                    self.current_solution_step = 0
-                    self.update_solution_display()
+                    self._schedule_redraw()
+                    self._invalidate_solution()
                     self.status_label.config(text=f"Loaded: {selected_puzzle['name']}")
                     dialog.destroy()
         
         ttk.Button(dialog, text="Load", command=load_selected).pack(pady=10)
     
     def update_statistics(self):
-        """Update statistics display with better formatting."""
-        stats = self.db.get_solve_statistics()
-        stats_text = "📈 Your Statistics:\n"
-        stats_text += "─" * 20 + "\n"
-        stats_text += f"🎮 Puzzles Solved: {stats['total_solved']}\n"
-        stats_text += f"📊 Avg Moves: {stats['average_moves']}\n"
-        stats_text += f"⏱️  Avg Time: {stats['average_time']}s\n"
+        """
+        Update statistics display with better formatting.
+        The numbers only change when a solve is recorded, so the database is
+        queried once and again only after _stats_cache has been cleared.
+        """
+        if self._stats_cache is not None:
+            return  # The label already shows these numbers
+        
+        stats = self._stats_cache = self.db.get_solve_statistics()
         if stats['best_moves'] > 0:
-            stats_text += f"🏆 Best: {stats['best_moves']} moves"
+            best = f"{stats['best_moves']} moves"
         else:
-            stats_text += f"🏆 Best: Not set yet"
-        self.stats_label.config(text=stats_text, font=("Arial", 9))
+            best = "Not set yet"
+        self.stats_label.config(text=self.STATS_TEMPLATE.format(best=best, **stats))
     
     def run(self):
         """Start the GUI application."""
         self.root.mainloop()
+        # Stop any search still running before closing the database
+        if self._solver_future is not None:
+            self._solver.cancel = True
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+        self.db.close()
 
@@ -0,0 +1,213 @@
+"""
+IDA* SOLVER MODULE - Step 3b: Understanding Informed Search
+
+BFS has to remember every state it has seen, which is fine for the
+8-puzzle (181,440 states) but hopeless for the 15-puzzle (over 10 trillion).
+IDA* (Iterative Deepening A*) fixes this:
+1. Run a depth-first search, but stop any branch whose estimated total
+   cost f = g + h goes over a threshold
+   - g = moves made so far
+   - h = Manhattan distance (how far every tile is from its goal square)
+2. If nothing was found, raise the threshold to the smallest f that went
+   over it and search again
+3. Because h never overestimates, the first solution found is the SHORTEST
+
+Memory use is only the current path (plus a small fixed-size table of
+recently seen states), so larger puzzles become solvable.
+"""
+
+import logging
+from typing import Callable, List, Optional, Tuple
+from puzzle_logic import Puzzle
+from bfs_solver import (SolveCancelled, _neighbor_table, _tile_bits, _trivial_result,
+                        decode_solution)
+
+
+# Transposition table: a fixed-size table of recently expanded states
+_TT_BITS = 20
+_TT_MASK = (1 << _TT_BITS) - 1
+_HASH_MULT = 0x9E3779B97F4A7C15
+
+_FOUND = -1
+_INF = float('inf')
+
+# How often (in nodes, minus one) the search checks for cancellation
+_CANCEL_CHECK_MASK = 0x3FFF
+
+
+def _manhattan_table(size: int) -> List[List[int]]:
+    """
+    Precompute the Manhattan distance of every tile from every position.
+    
+    Returns:
+        table[tile][index] = distance of `tile` at flat `index` from its goal
+    """
+    n = size * size
+    table = [[0] * n]  # The empty space doesn't count
+    for tile in range(1, n):
+        goal_row, goal_col = divmod(tile - 1, size)
+        table.append([abs(i // size - goal_row) + abs(i % size - goal_col)
+                      for i in range(n)])
+    return table
+
+
+def _ida_star_core(start_state: int, start_blank: int, size: int, neighbors: tuple,
+                   is_cancelled: Optional[Callable[[], bool]] = None
+                   ) -> Tuple[Optional[bytes], int, int]:
+    """
+    Run IDA* on a packed board.
+    
+    Args:
+        start_state: Packed start board
+        start_blank: Flat index of the empty space in the start board
+        size: Grid size
+        neighbors: Neighbor table from _neighbor_table(size)
+        is_cancelled: Optional callback, checked every few thousand nodes;
+            the search raises SolveCancelled as soon as it returns True
+    
+    Returns:
+        Tuple of (move codes or None, nodes_explored, iterations)
+    """
+    bits = _tile_bits(size)
+    mask = (1 << bits) - 1
+    shifts = [bits * i for i in range(size * size)]
+    dist = _manhattan_table(size)
+    
+    # Each slot remembers one state and the (threshold, g) it was expanded
+    # with, packed as (threshold << 10) + g
+    tt_keys = [None] * (_TT_MASK + 1)
+    tt_stamps = [0] * (_TT_MASK + 1)
+    
+    path = bytearray()
+    nodes_explored = 0
+    start_h = sum(dist[(start_state >> shifts[i]) & mask][i] for i in range(size * size))
+    threshold = start_h
+    
+    def search(state: int, blank: int, g: int, h: int, prev_blank: int):
+        nonlocal nodes_explored
+        nodes_explored += 1
+        if (not nodes_explored & _CANCEL_CHECK_MASK and is_cancelled is not None
+                and is_cancelled()):
+            raise SolveCancelled()
+        
+        f = g + h
+        if f > threshold:
+            return f
+        if h == 0:
+            return _FOUND
+        
+        # Already expanded this iteration with at least as much budget left?
+        slot = ((state * _HASH_MULT) >> 32) & _TT_MASK
+        base = threshold << 10
+        if tt_keys[slot] == state and base <= tt_stamps[slot] <= base + g:
+            return _INF
+        tt_keys[slot] = state
+        tt_stamps[slot] = base + g
+        
+        minimum = _INF
+        blank_shift = shifts[blank]
+        for target, move in neighbors[blank]:
+            # Never undo the move we just made
+            if target == prev_blank:
+                continue
+            target_shift = shifts[target]
+            tile = (state >> target_shift) & mask
+            child = state - (tile << target_shift) + (tile << blank_shift)
+            # Only the moved tile's distance changes
+            child_h = h - dist[tile][target] + dist[tile][blank]
+            
+            t = search(child, target, g + 1, child_h, blank)
+            if t == _FOUND:
+                path.append(move)
+                return _FOUND
+            if t < minimum:
+                minimum = t
+        return minimum
+    
+    iterations = 0
+    while True:
+        iterations += 1
+        t = search(start_state, start_blank, 0, start_h, -1)
+        if t == _FOUND:
+            path.reverse()
+            return bytes(path), nodes_explored, iterations
+        if t == _INF:
+            return None, nodes_explored, iterations
+        threshold = t
+
+
+class IDAStarSolver:
+    """
+    Solves the N-Puzzle using IDA* with the Manhattan distance heuristic.
+    Same interface as BFSSolver, but practical for 15- and 24-puzzles.
+    """
+    
+    def __init__(self, puzzle: Puzzle):
+        """
+        Initialize the solver with a puzzle.
+        
+        Args:
+            puzzle: The Puzzle instance to solve (any size)
+        """
+        self.initial_puzzle = puzzle.copy()
+        # Set to True (e.g. from another thread) to stop a running solve
+        self.cancel = False
+        self._neighbors = _neighbor_table(puzzle.size)
+        start_row, start_col = puzzle.find_empty()
+        self._initial_state = puzzle.packed()
+        self._initial_blank = start_row * puzzle.size + start_col
+    
+    def _core_args(self) -> tuple:
+        """The plain-int arguments of _ida_star_core."""
+        return (self._initial_state, self._initial_blank,
+                self.initial_puzzle.size, self._neighbors, lambda: self.cancel)
+    
+    def _solve_core(self) -> Tuple[Optional[bytes], dict]:
+        """
+        Shared body of solve() and solve_with_stats().
+        
+        Returns:
+            Tuple of (move codes or None, statistics_dict)
+        """
+        trivial, codes = _trivial_result(self.initial_puzzle)
+        if trivial:
+            return codes, {'nodes_explored': 0, 'solution_length': 0}
+        
+        path, nodes_explored, iterations = _ida_star_core(*self._core_args())
+        if path is None:
+            return None, {'nodes_explored': nodes_explored, 'solution_length': 0}
+        
+        stats = {
+            'nodes_explored': nodes_explored,
+            'solution_length': len(path),
+            'iterations': iterations
+        }
+        return path, stats
+    
+    def solve(self) -> Optional[List[str]]:
+        """
+        Solve the puzzle using IDA*.
+        
+        Returns:
+            List of moves to solve the puzzle, or None if unsolvable
+            
+        Raises:
+            SolveCancelled: If `cancel` was set while searching
+        """
+        codes, stats = self._solve_core()
+        if codes:
+            logging.info("IDA* solution found, explored %d states", stats['nodes_explored'])
+        return None if codes is None else decode_solution(codes)
+    
+    def solve_with_stats(self) -> Tuple[Optional[List[str]], dict]:
+        """
+        Solve the puzzle and return statistics.
+        
+        Returns:
+            Tuple of (solution_path, statistics_dict)
+            
+        Raises:
+            SolveCancelled: If `cancel` was set while searching
+        """
+        codes, stats = self._solve_core()
+        return None if codes is None else decode_solution(codes), stats
@@ -5,8 +5,12 @@ This is the main file that starts the application.
 It's the entry point - when you run this file, everything starts!
 
 To run: python main.py
+(set NPUZZLE_VERBOSE=1 to see startup messages)
 """
 
+import logging
+import os
+
 from gui import PuzzleGUI
 
 
@@ -14,17 +18,9 @@ def main():
     """
     Main function - creates and runs the GUI application.
     """
-    print("=" * 50)
-    print("N-Puzzle Solver - Starting Application")
-    print("=" * 50)
-    print("\nFeatures:")
-    print("  ✓ Multiple puzzle sizes (8, 15, 24 puzzles)")
-    print("  ✓ Interactive puzzle board")
-    print("  ✓ BFS algorithm solver")
-    print("  ✓ Step-by-step solution display")
-    print("  ✓ Save/Load puzzles")
-    print("  ✓ Statistics tracking")
-    print("\n" + "=" * 50 + "\n")
+    # Startup messages are opt-in so the window isn't kept waiting on console output
+    logging.basicConfig(level=logging.INFO if os.environ.get("NPUZZLE_VERBOSE") else logging.WARNING)
+    logging.info("N-Puzzle Solver starting (sizes: 8, 15, 24 puzzles)")
     
     # Create and run the GUI
     app = PuzzleGUI()
@@ -2,7 +2,8 @@
 PUZZLE LOGIC MODULE - Step 2: Understanding the Game Rules
 
 This module handles the N-Puzzle game mechanics (supports 8, 15, 24 puzzles):
-- Board representation (NxN grid with numbers and one empty space)
+- Board representation (NxN grid with numbers and one empty space,
+  stored row by row in one flat bytearray)
 - Valid moves (up, down, left, right)
 - Goal state checking
 - Puzzle validation
@@ -13,60 +14,181 @@ Supported Sizes:
 - 24-Puzzle: 5x5 grid (24 tiles + 1 empty)
 """
 
-from typing import List, Tuple, Optional
+from bisect import bisect_right, insort
+from typing import Dict, List, Tuple, Optional, Union
 import random
 
 
+# Directions are small ints; MOVE_NAMES[code] is the readable name.
+# Codes are paired so that code ^ 1 is always the opposite move.
+UP, DOWN, LEFT, RIGHT = 0, 1, 2, 3
+MOVE_NAMES = ('up', 'down', 'left', 'right')
+_MOVE_CODES = {name: code for code, name in enumerate(MOVE_NAMES)}
+
+# (row change, col change) of the empty space for each direction
+_DELTAS = ((-1, 0), (1, 0), (0, -1), (0, 1))
+
+
+def _build_valid_moves(size: int) -> Dict[Tuple[int, int], Tuple[int, ...]]:
+    """
+    Work out the legal moves for every position of the empty space.
+    
+    Args:
+        size: Grid size
+        
+    Returns:
+        Dictionary mapping (row, col) of the empty space to its moves
+    """
+    table = {}
+    for row in range(size):
+        for col in range(size):
+            moves = []
+            if row > 0:
+                moves.append(UP)  # Not in top row
+            if row < size - 1:
+                moves.append(DOWN)  # Not in bottom row
+            if col > 0:
+                moves.append(LEFT)  # Not in left column
+            if col < size - 1:
+                moves.append(RIGHT)  # Not in right column
+            table[(row, col)] = tuple(moves)
+    return table
+
+
+# Legal moves only depend on where the empty space is, so they are worked
+# out once here: _VALID_MOVES[size][(row, col)]
+_VALID_MOVES = {size: _build_valid_moves(size) for size in range(3, 6)}
+
+
+def _count_inversions(a: List[int]) -> Tuple[List[int], int]:
+    """
+    Count the pairs (i < j) with a[i] > a[j].
+    Each element is inserted into a sorted list of the ones before it;
+    the elements above its insertion point are exactly the earlier, larger
+    ones it forms an inversion with. That is O(N log N) comparisons (done in
+    C by bisect) but O(N^2) element moves, which is fine for N <= 24.
+    
+    Args:
+        a: List of numbers
+        
+    Returns:
+        Tuple of (sorted copy of a, number of inversions)
+    """
+    seen = []
+    count = 0
+    for value in a:
+        count += len(seen) - bisect_right(seen, value)
+        insort(seen, value)
+    return seen, count
+
+
 class Puzzle:
     """
     Represents the N-Puzzle game state and operations.
     Supports multiple grid sizes dynamically.
+    
+    Puzzle(size=...) actually returns an instance of the subclass for that
+    size (Puzzle3x3, Puzzle4x4 or Puzzle5x5, defined below), which carries
+    the size's tables as class constants - so methods read them directly
+    instead of looking them up by size each time.
     """
     
-    def __init__(self, size: int = 3, state: Optional[List[List[int]]] = None):
+    # Per-size constants, filled in by each size's subclass (see _specialize)
+    SIZE = 0
+    GOAL = b''  # Flat cells of the solved puzzle
+    VALID_MOVES: Dict[Tuple[int, int], Tuple[int, ...]] = {}  # By empty (row, col)
+    # Zobrist keys: ZOBRIST[index][value] is a random 63-bit key (small
+    # enough for hash() to use as is), and a board's hash is the XOR of the
+    # keys of its cells. Swapping two cells only changes four keys, so
+    # make_move can keep the hash up to date instead of rehashing the board.
+    ZOBRIST: Tuple[Tuple[int, ...], ...] = ()
+    
+    def __new__(cls, size: Optional[int] = None,
+                state: Optional[Union[List[List[int]], bytes, bytearray]] = None):
+        """Pick the subclass for the puzzle's size (__init__ then sets it up)."""
+        if cls is Puzzle:
+            if state is not None and not isinstance(state, (bytes, bytearray)):
+                size = len(state)  # Infer size from a 2D state
+            elif size is None:
+                size = 3
+            # An unsupported size stays a plain Puzzle, whose __init__ rejects it
+            cls = _SIZED_CLASSES.get(size, cls)
+        return super().__new__(cls)
+    
+    def __init__(self, size: Optional[int] = None,
+                 state: Optional[Union[List[List[int]], bytes, bytearray]] = None):
         """
         Initialize the puzzle.
         
         Args:
-            size: Grid size (3 for 8-puzzle, 4 for 15-puzzle, 5 for 24-puzzle)
-            state: Optional initial state. If None, starts with goal state.
+            size: Grid size (3 for 8-puzzle, 4 for 15-puzzle, 5 for 24-puzzle).
+                Defaults to 3, or to the size of the subclass being created.
+            state: Optional initial state, either a 2D list or the flat cells
+                (row by row). If None, starts with goal state.
         """
+        if state is not None and not isinstance(state, (bytes, bytearray)):
+            size = len(state)  # Infer size from a 2D state
+        elif size is None:
+            size = self.SIZE or 3
         if size < 3 or size > 5:
             raise ValueError("Size must be between 3 and 5")
         
         self.size = size
         self.total_tiles = size * size - 1  # e.g., 3x3 = 8 tiles, 4x4 = 15 tiles
         
+        # The board, flattened: cell (row, col) is cells[row * size + col].
+        # One byte per tile means no per-row lists to follow, and comparing
+        # or hashing a board is a single bytes operation.
         if state is None:
-            self.state = self._generate_goal_state()
+            self.cells = bytearray(self._generate_goal_state())
+        elif isinstance(state, (bytes, bytearray)):
+            self.cells = bytearray(state)  # Copy
         else:
-            self.state = [row[:] for row in state]  # Deep copy
-            self.size = len(state)  # Infer size from state
+            self.cells = bytearray(value for row in state for value in row)
+        
+        # Where the empty space is; kept up to date by make_move so nobody
+        # has to scan the grid for it
+        self.empty_pos = self._locate_empty()
+        self._hash = self._full_hash()
+    
+    def _full_hash(self) -> int:
+        """Hash the whole board from scratch (make_move updates it after that)."""
+        table = self.ZOBRIST
+        h = 0
+        for index, value in enumerate(self.cells):
+            h ^= table[index][value]
+        return h
     
-    def _generate_goal_state(self) -> List[List[int]]:
+    def _generate_goal_state(self) -> bytes:
         """
-        Generate the goal state for the current puzzle size.
+        Get the goal state for the current puzzle size.
+        It is built once per size, as the GOAL class constant.
         
         Returns:
-            2D list representing the solved puzzle
-        """
-        goal = []
-        num = 1
-        for i in range(self.size):
-            row = []
-            for j in range(self.size):
-                if num <= self.total_tiles:
-                    row.append(num)
-                    num += 1
-                else:
-                    row.append(0)  # Empty space at the end
-            goal.append(row)
-        return goal
+            Flat cells of the solved puzzle: 1, 2, ..., N, then the empty space
+        """
+        return self.GOAL
+    
+    @property
+    def state(self) -> List[List[int]]:
+        """
+        The board as a 2D list (a fresh copy - changing it doesn't change
+        the puzzle). Assigning a 2D list replaces the board.
+        """
+        size = self.size
+        return [list(self.cells[i:i + size]) for i in range(0, size * size, size)]
+    
+    @state.setter
+    def state(self, value: List[List[int]]):
+        self.cells = bytearray(v for row in value for v in row)
+        self.empty_pos = self._locate_empty()
+        self._hash = self._full_hash()
     
     @property
     def GOAL_STATE(self) -> List[List[int]]:
         """Return the goal state for this puzzle size."""
-        return self._generate_goal_state()
+        goal = self._generate_goal_state()
+        return [list(goal[i:i + self.size]) for i in range(0, len(goal), self.size)]
     
     def find_empty(self) -> Tuple[int, int]:
         """
@@ -75,11 +197,14 @@ class Puzzle:
         Returns:
             Tuple (row, col) of empty space position
         """
-        for i in range(self.size):
-            for j in range(self.size):
-                if self.state[i][j] == 0:
-                    return (i, j)
-        return (-1, -1)  # Should never happen
+        return self.empty_pos
+    
+    def _locate_empty(self) -> Tuple[int, int]:
+        """Scan the grid for the empty space (only needed for a new board)."""
+        index = self.cells.find(0)
+        if index < 0:
+            return (-1, -1)  # Should never happen
+        return divmod(index, self.size)
     
     def is_goal(self) -> bool:
         """
@@ -88,67 +213,59 @@ class Puzzle:
         Returns:
             True if puzzle is solved
         """
-        goal = self._generate_goal_state()
-        return self.state == goal
+        # The goal ends with the empty space: most boards fail on that alone
+        if self.cells[-1]:
+            return False
+        return self.cells == self.GOAL
     
-    def get_valid_moves(self) -> List[str]:
+    def get_valid_moves(self) -> Tuple[int, ...]:
         """
-        Get list of valid moves from current state.
-        Moves: 'up', 'down', 'left', 'right' (relative to empty space)
+        Get the valid moves from current state (looked up, not recomputed).
+        Moves: UP, DOWN, LEFT, RIGHT (relative to empty space);
+        MOVE_NAMES[move] gives the name of each.
         
         Returns:
-            List of valid move directions
+            Tuple of valid move directions
         """
-        row, col = self.find_empty()
-        valid_moves = []
-        
-        # Can move up if empty space is not in top row
-        if row > 0:
-            valid_moves.append('up')
-        
-        # Can move down if empty space is not in bottom row
-        if row < self.size - 1:
-            valid_moves.append('down')
-        
-        # Can move left if empty space is not in left column
-        if col > 0:
-            valid_moves.append('left')
-        
-        # Can move right if empty space is not in right column
-        if col < self.size - 1:
-            valid_moves.append('right')
-        
-        return valid_moves
+        return self.VALID_MOVES[self.empty_pos]
     
-    def make_move(self, direction: str) -> bool:
+    def make_move(self, direction: Union[int, str]) -> bool:
         """
         Make a move in the specified direction.
         
         Args:
-            direction: 'up', 'down', 'left', or 'right'
+            direction: UP, DOWN, LEFT or RIGHT, or the name
+                'up', 'down', 'left' or 'right'
             
         Returns:
             True if move was successful, False otherwise
         """
-        if direction not in self.get_valid_moves():
-            return False
+        if isinstance(direction, str):
+            direction = _MOVE_CODES.get(direction)
+            if direction is None:
+                return False
+        elif not 0 <= direction < 4:
+            return False  # Not a move code
         
-        row, col = self.find_empty()
-        
-        # Calculate new position based on direction
         # Remember: moving the empty space is like moving a tile in opposite direction
-        if direction == 'up':
-            new_row, new_col = row - 1, col
-        elif direction == 'down':
-            new_row, new_col = row + 1, col
-        elif direction == 'left':
-            new_row, new_col = row, col - 1
-        elif direction == 'right':
-            new_row, new_col = row, col + 1
+        row, col = self.empty_pos
+        d_row, d_col = _DELTAS[direction]
+        new_row, new_col = row + d_row, col + d_col
+        size = self.SIZE
+        if not (0 <= new_row < size and 0 <= new_col < size):
+            return False  # Would leave the board
         
         # Swap empty space with tile
-        self.state[row][col], self.state[new_row][new_col] = \
-            self.state[new_row][new_col], self.state[row][col]
+        cells = self.cells
+        here, there = row * size + col, new_row * size + new_col
+        tile = cells[there]
+        cells[here], cells[there] = tile, 0
+        self.empty_pos = (new_row, new_col)
+        
+        # The tile and the empty space traded places: swap their hash keys
+        table = self.ZOBRIST
+        self._hash ^= (table[here][0] ^ table[here][tile]
+                       ^ table[there][tile] ^ table[there][0])
         
         return True
     
@@ -165,10 +282,7 @@ class Puzzle:
             moves = self.size * 50  # 3x3=150, 4x4=200, 5x5=250
         
         for _ in range(moves):
-            valid_moves = self.get_valid_moves()
-            if valid_moves:
-                random_move = random.choice(valid_moves)
-                self.make_move(random_move)
+            self.make_move(random.choice(self.VALID_MOVES[self.empty_pos]))
     
     def copy(self):
         """
@@ -178,17 +292,41 @@ class Puzzle:
         Returns:
             New Puzzle instance with same state
         """
-        return Puzzle(size=self.size, state=self.state)
+        # Skip __init__: the size is known, the board only needs its bytes
+        # copied, and the empty space doesn't have to be searched for again
+        clone = self.__class__.__new__(self.__class__)
+        clone.size = self.size
+        clone.total_tiles = self.total_tiles
+        clone.cells = self.cells[:]
+        clone.empty_pos = self.empty_pos
+        clone._hash = self._hash
+        return clone
+    
+    def packed(self) -> int:
+        """
+        Fold the board into a single int: cell i (row * size + col) lives at
+        bit offset i * bits, with 4 bits per tile up to the 15-puzzle and 5
+        for the 24-puzzle. Comparing, hashing and copying a state then
+        become plain int operations - this is the form the solvers search on.
+        
+        Returns:
+            The packed board
+        """
+        bits = 4 if self.size <= 4 else 5
+        packed = 0
+        for value in reversed(self.cells):
+            packed = (packed << bits) | value
+        return packed
     
     def __eq__(self, other):
         """Check if two puzzles have the same state."""
         if not isinstance(other, Puzzle):
             return False
-        return self.state == other.state and self.size == other.size
+        return self.cells == other.cells and self.size == other.size
     
     def __hash__(self):
-        """Make puzzle hashable (needed for sets in BFS)."""
-        return hash(tuple(tuple(row) for row in self.state))
+        """Make puzzle hashable (needed for sets in BFS); kept current by make_move."""
+        return self._hash
     
     def __str__(self):
         """String representation for debugging."""
@@ -203,28 +341,46 @@ class Puzzle:
         Returns:
             True if puzzle can be solved
         """
-        # Flatten the 2D array
-        flat = [self.state[i][j] for i in range(self.size) 
-                for j in range(self.size) if self.state[i][j] != 0]
+        # The tiles in order, without the empty space (one C-level pass)
+        flat = self.cells.replace(b'\x00', b'')
         
-        # Count inversions
-        inversions = 0
-        for i in range(len(flat)):
-            for j in range(i + 1, len(flat)):
-                if flat[i] > flat[j]:
-                    inversions += 1
+        # Count inversions (sorted-list insert instead of comparing every pair)
+        _, inversions = _count_inversions(flat)
         
         # For odd-sized grids (3x3, 5x5), solvable if inversions are even
         if self.size % 2 == 1:
             return inversions % 2 == 0
         else:
             # For even-sized grids (4x4), also consider empty space row
-            empty_row, _ = self.find_empty()
+            empty_row, _ = self.empty_pos
             # Count from bottom (size - 1 is bottom row)
             empty_row_from_bottom = self.size - 1 - empty_row
             return (inversions + empty_row_from_bottom) % 2 == 0
 
 
+def _specialize(size: int) -> type:
+    """
+    Build the Puzzle subclass for one grid size, with that size's goal,
+    move table and Zobrist keys baked in as class constants.
+    """
+    n = size * size
+    # Own generator with a fixed seed: hashes stay the same from run to run
+    # and building the keys doesn't disturb the shuffle's randomness
+    rng = random.Random(n)
+    return type(f"Puzzle{size}x{size}", (Puzzle,), {
+        '__doc__': f"A {size}x{size} Puzzle (create it with Puzzle(size={size})).",
+        'SIZE': size,
+        'GOAL': bytes(range(1, n)) + b'\x00',  # Empty space at the end
+        'VALID_MOVES': _VALID_MOVES[size],
+        'ZOBRIST': tuple(tuple(rng.getrandbits(63) for _ in range(n)) for _ in range(n)),
+    })
+
+
+Puzzle3x3 = _specialize(3)
+Puzzle4x4 = _specialize(4)
+Puzzle5x5 = _specialize(5)
+_SIZED_CLASSES = {3: Puzzle3x3, 4: Puzzle4x4, 5: Puzzle5x5}
+
 # Alias for backward compatibility
 Puzzle8 = Puzzle
 
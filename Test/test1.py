@@ -0,0 +1,218 @@
+"""
+TESTS - Regression checks for the solvers and the storage format
+
+Run from the Test directory:
+    python -m unittest test1
+
+The solver cores are compared against a plain BFS over Puzzle objects
+(the simplest possible search, so it serves as the reference answer).
+"""
+
+import json
+import os
+import random
+import sqlite3
+import tempfile
+import unittest
+from collections import deque
+
+from puzzle_logic import Puzzle
+from bfs_solver import (BFSSolver, _bfs_core, _goal_state, _neighbor_table,
+                        decode_solution, encode_solution, solve_batch)
+from ida_star_solver import IDAStarSolver, _ida_star_core
+from database import PuzzleDatabase, _decode_state, _encode_state
+
+
+def reference_distance(puzzle: Puzzle):
+    """Shortest solution length by a plain BFS, or None if unsolvable."""
+    goal = Puzzle(size=puzzle.size)
+    queue = deque([(puzzle, 0)])
+    seen = {puzzle}
+    while queue:
+        current, depth = queue.popleft()
+        if current == goal:
+            return depth
+        for move in current.get_valid_moves():
+            child = current.copy()
+            child.make_move(move)
+            if child not in seen:
+                seen.add(child)
+                queue.append((child, depth + 1))
+    return None
+
+
+def random_puzzle(size: int, moves: int, rng: random.Random) -> Puzzle:
+    """A solvable board made by random moves away from the goal."""
+    puzzle = Puzzle(size=size)
+    for _ in range(moves):
+        puzzle.make_move(rng.choice(puzzle.get_valid_moves()))
+    return puzzle
+
+
+def unsolvable_puzzle(size: int) -> Puzzle:
+    """The goal board with tiles 1 and 2 swapped (odd permutation)."""
+    cells = bytearray(Puzzle(size=size).cells)
+    cells[0], cells[1] = cells[1], cells[0]
+    return Puzzle(size=size, state=bytes(cells))
+
+
+def apply_moves(puzzle: Puzzle, codes: bytes) -> Puzzle:
+    """Play move codes on a copy of the board (every move must be legal)."""
+    board = puzzle.copy()
+    for code in codes:
+        assert board.make_move(code), f"illegal move {code}"
+    return board
+
+
+def core_args(puzzle: Puzzle) -> tuple:
+    """(packed state, blank index, neighbor table) for calling a core directly."""
+    row, col = puzzle.find_empty()
+    return puzzle.packed(), row * puzzle.size + col, _neighbor_table(puzzle.size)
+
+
+class SolverCoreTests(unittest.TestCase):
+    """Both search cores must find a shortest path to the goal."""
+
+    def setUp(self):
+        self.rng = random.Random(1234)
+        self.boards = [random_puzzle(3, self.rng.randint(1, 60), self.rng) for _ in range(25)]
+
+    def test_bfs_core_matches_reference(self):
+        for puzzle in self.boards:
+            if puzzle.is_goal():
+                continue
+            state, blank, neighbors = core_args(puzzle)
+            path, _, _ = _bfs_core(state, blank, _goal_state(3), 3, neighbors)
+            self.assertEqual(len(path), reference_distance(puzzle))
+            self.assertTrue(apply_moves(puzzle, path).is_goal())
+
+    def test_ida_star_core_matches_reference(self):
+        for puzzle in self.boards:
+            state, blank, neighbors = core_args(puzzle)
+            path, _, _ = _ida_star_core(state, blank, 3, neighbors)
+            self.assertEqual(len(path), reference_distance(puzzle))
+            self.assertTrue(apply_moves(puzzle, path).is_goal())
+
+    def test_solvers_handle_solved_and_unsolvable_boards(self):
+        for solver_class in (BFSSolver, IDAStarSolver):
+            self.assertEqual(solver_class(Puzzle(size=3)).solve(), [])
+            self.assertIsNone(solver_class(unsolvable_puzzle(3)).solve())
+
+    def test_solvability_matches_reference(self):
+        self.assertIsNone(reference_distance(unsolvable_puzzle(3)))
+        for puzzle in self.boards:
+            self.assertTrue(puzzle.is_solvable())
+
+    def test_ida_star_solves_larger_boards(self):
+        for size in (4, 5):
+            puzzle = random_puzzle(size, 20, self.rng)
+            path = IDAStarSolver(puzzle).solve()
+            self.assertTrue(apply_moves(puzzle, encode_solution(path)).is_goal())
+
+
+class SolveBatchTests(unittest.TestCase):
+    """solve_batch must give the same answers as solving one at a time."""
+
+    def test_solved_board(self):
+        self.assertEqual(solve_batch([Puzzle(size=3)]), [b''])
+
+    def test_unsolvable_board(self):
+        self.assertEqual(solve_batch([unsolvable_puzzle(3)]), [None])
+
+    def test_empty_batch(self):
+        self.assertEqual(solve_batch([]), [])
+
+    def test_mixed_batch_keeps_order(self):
+        rng = random.Random(99)
+        puzzles = [random_puzzle(3, 30, rng), Puzzle(size=3), unsolvable_puzzle(3),
+                   random_puzzle(3, 40, rng), random_puzzle(4, 20, rng)]
+        results = solve_batch(puzzles, max_workers=2)
+        self.assertEqual(len(results), len(puzzles))
+        self.assertEqual(results[1], b'')
+        self.assertIsNone(results[2])
+        for i in (0, 3):
+            self.assertEqual(len(results[i]), reference_distance(puzzles[i]))
+        for i in (0, 3, 4):
+            self.assertTrue(apply_moves(puzzles[i], results[i]).is_goal())
+        # The 15-puzzle goes to IDA*, which finds the same length as a single solve
+        self.assertEqual(decode_solution(results[4]), IDAStarSolver(puzzles[4]).solve())
+
+
+class StateEncodingTests(unittest.TestCase):
+    """Boards must survive a trip through the database format."""
+
+    def test_round_trip_all_sizes(self):
+        rng = random.Random(7)
+        for size in (3, 4, 5):
+            for board in (Puzzle(size=size), random_puzzle(size, 50, rng), unsolvable_puzzle(size)):
+                state = board.state
+                self.assertEqual(_decode_state(_encode_state(state), size), state)
+
+    def test_legacy_json_rows(self):
+        for size in (3, 4, 5):
+            state = Puzzle(size=size).state
+            self.assertEqual(_decode_state(json.dumps(state), size), state)
+
+        # A row written by an older version still loads
+        db = PuzzleDatabase(":memory:")
+        try:
+            state = random_puzzle(4, 30, random.Random(4)).state
+            cursor = db.shared_connection().execute(
+                "INSERT INTO saved_puzzles (name, puzzle_state, puzzle_size) VALUES (?, ?, ?)",
+                ("legacy", json.dumps(state), 4))
+            self.assertEqual(db.load_puzzle(cursor.lastrowid), state)
+        finally:
+            db.close()
+
+    def test_old_schema_is_migrated(self):
+        with tempfile.TemporaryDirectory() as folder:
+            path = os.path.join(folder, "old.db")
+            conn = sqlite3.connect(path)
+            conn.execute("CREATE TABLE saved_puzzles (id INTEGER PRIMARY KEY AUTOINCREMENT, "
+                         "name TEXT NOT NULL, puzzle_state TEXT NOT NULL, "
+                         "created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP)")
+            conn.execute("CREATE TABLE solve_history (id INTEGER PRIMARY KEY AUTOINCREMENT, "
+                         "puzzle_state TEXT NOT NULL, solution_moves INTEGER, solve_time REAL, "
+                         "algorithm TEXT DEFAULT 'BFS', "
+                         "solved_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP)")
+            conn.execute("INSERT INTO saved_puzzles (name, puzzle_state) VALUES (?, ?)",
+                         ("old", json.dumps(Puzzle(size=3).state)))
+            conn.commit()
+            conn.close()
+
+            db = PuzzleDatabase(path)
+            try:
+                self.assertEqual(db.load_puzzle(1), Puzzle(size=3).state)
+                db.save_solve_history(Puzzle(size=3).state, 2, 0.1, 'BFS', b'\x01\x00')
+                self.assertEqual(db.get_solve_statistics()['total_solved'], 1)
+            finally:
+                db.close()
+
+    def test_database_round_trip(self):
+        db = PuzzleDatabase(":memory:")
+        try:
+            for size in (3, 4, 5):
+                state = random_puzzle(size, 50, random.Random(size)).state
+                puzzle_id = db.save_puzzle(f"board {size}", state, size)
+                self.assertEqual(db.load_puzzle(puzzle_id), state)
+        finally:
+            db.close()
+
+    def test_save_solve_history_many_keeps_solutions(self):
+        db = PuzzleDatabase(":memory:")
+        try:
+            puzzles = [random_puzzle(3, 20, random.Random(5)), Puzzle(size=3)]
+            solutions = solve_batch(puzzles, max_workers=1)
+            db.save_solve_history_many(
+                [(p.state, len(codes), 0.5, 'BFS', codes) for p, codes in zip(puzzles, solutions)]
+                + [(puzzles[0].state, 3, 0.5, 'BFS')])  # Old 4-field form still works
+            stored = [row[0] for row in db.shared_connection().execute(
+                "SELECT solution FROM solve_history ORDER BY id")]
+            self.assertEqual(stored, solutions + [None])
+            self.assertEqual(db.get_solve_statistics()['total_solved'], 3)
+        finally:
+            db.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -20,8 +20,84 @@ class PathfindingResult:
         self.nodes_explored = 0
 
 
+# bytes.translate table: 1 for every cell value except WALL
+_PASSABLE_TABLE = bytes(int(value != CellType.WALL.value) for value in range(256))
+
+
+def _passable_map(grid: Grid) -> Tuple[bytearray, int]:
+    """
+    Snapshot which cells can be walked on, as a flat bytearray.
+    
+    The map has a one-cell wall border all round, so a node is a single int
+    ((row + 1) * width + col + 1) and its 4 neighbors are node +/- 1 and
+    node +/- width - no bounds checks and no (row, col) tuples needed.
+    
+    Every search builds its own map and reuses it as its visited set: a node
+    is set to 0 once it has been seen, so a single byte test covers both
+    "is it a wall?" and "has it been visited?".
+    
+    Args:
+        grid: Grid instance
+        
+    Returns:
+        Tuple of (map with 1 for open cells, row width of the map)
+    """
+    cols = grid.cols
+    width = cols + 2
+    passable = bytearray(width * (grid.rows + 2))
+    # One table lookup per cell, run entirely in C by translate()
+    open_cells = grid.cells.translate(_PASSABLE_TABLE)
+    for row in range(grid.rows):
+        base = (row + 1) * width + 1
+        passable[base:base + cols] = open_cells[row * cols:(row + 1) * cols]
+    return passable, width
+
+
+def _build_path(parent: Dict[int, Optional[int]], end: int) -> List[int]:
+    """Follow parent links back from end and return the nodes start-first."""
+    path = []
+    node = end
+    while node is not None:
+        path.append(node)
+        node = parent[node]
+    path.reverse()
+    return path
+
+
+def _report_visits(on_visit: Callable, exploring: List[int], reported: int, width: int) -> int:
+    """
+    Pass the nodes popped since the last report to on_visit as (row, col)
+    positions, in one call.
+    
+    Returns:
+        How many nodes of exploring have been reported now
+    """
+    on_visit([(node // width - 1, node % width - 1) for node in exploring[reported:]])
+    return len(exploring)
+
+
+def _finish(result: PathfindingResult, width: int, exploring: List[int], visited: List[int],
+            path: Optional[List[int]], nodes_explored: int,
+            on_visit: Optional[Callable] = None, reported: int = 0) -> PathfindingResult:
+    """
+    Fill in result, turning node ids back into (row, col) positions, and
+    report any visits on_visit hasn't seen yet.
+    """
+    result.exploring = [(node // width - 1, node % width - 1) for node in exploring]
+    if on_visit and reported < len(exploring):
+        on_visit(result.exploring[reported:])
+    result.visited = [(node // width - 1, node % width - 1) for node in visited]
+    if path is not None:
+        result.path = [(node // width - 1, node % width - 1) for node in path]
+        result.found = True
+        result.path_length = len(path) - 1
+    result.nodes_explored = nodes_explored
+    return result
+
+
 def bfs(grid: Grid, start: Tuple[int, int], end: Tuple[int, int],
-        on_visit: Optional[Callable] = None) -> PathfindingResult:
+        on_visit: Optional[Callable] = None, batch_size: int = 64,
+        track_visited: bool = False) -> PathfindingResult:
     """
     Breadth-First Search algorithm.
     
@@ -29,7 +105,12 @@ def bfs(grid: Grid, start: Tuple[int, int], end: Tuple[int, int],
         grid: Grid instance
         start: Start position (row, col)
         end: End position (row, col)
-        on_visit: Optional callback function called when visiting a node
+        on_visit: Optional callback, called with a list of the (row, col)
+            positions visited since its last call (every batch_size nodes,
+            and once more when the search ends)
+        batch_size: How many visited nodes to collect per on_visit call
+        track_visited: Fill in result.visited (every node reached, in order);
+            off by default since most callers only need the path
         
     Returns:
         PathfindingResult object
@@ -39,43 +120,45 @@ def bfs(grid: Grid, start: Tuple[int, int], end: Tuple[int, int],
     if not grid.is_valid(*start) or not grid.is_valid(*end):
         return result
     
-    queue = deque([start])
-    visited = {start}
-    parent = {start: None}
+    passable, width = _passable_map(grid)
+    start_id = (start[0] + 1) * width + start[1] + 1
+    end_id = (end[0] + 1) * width + end[1] + 1
+    offsets = (1, width, -1, -width)  # right, down, left, up
+    
+    queue = deque([start_id])
+    passable[start_id] = 0  # Visited
+    parent = {start_id: None}  # Also: every node reached
+    exploring = []
+    visited_order = []
+    reported = 0  # How many of exploring have been passed to on_visit
     
     while queue:
         current = queue.popleft()
-        result.exploring.append(current)
+        exploring.append(current)
         
-        if on_visit:
-            on_visit(current)
+        if on_visit and len(exploring) - reported >= batch_size:
+            reported = _report_visits(on_visit, exploring, reported, width)
         
-        if current == end:
-            # Reconstruct path
-            path = []
-            node = end
-            while node is not None:
-                path.append(node)
-                node = parent[node]
-            result.path = path[::-1]
-            result.found = True
-            result.path_length = len(result.path) - 1
-            result.nodes_explored = len(visited)
-            return result
+        if current == end_id:
+            return _finish(result, width, exploring, visited_order,
+                           _build_path(parent, end_id), len(parent), on_visit, reported)
         
-        for neighbor in grid.get_neighbors(*current):
-            if neighbor not in visited:
-                visited.add(neighbor)
+        for offset in offsets:
+            neighbor = current + offset
+            if passable[neighbor]:
+                passable[neighbor] = 0
                 parent[neighbor] = current
                 queue.append(neighbor)
-                result.visited.append(neighbor)
+                if track_visited:
+                    visited_order.append(neighbor)
     
-    result.nodes_explored = len(visited)
-    return result
+    return _finish(result, width, exploring, visited_order, None, len(parent),
+                   on_visit, reported)
 
 
 def dfs(grid: Grid, start: Tuple[int, int], end: Tuple[int, int],
-        on_visit: Optional[Callable] = None) -> PathfindingResult:
+        on_visit: Optional[Callable] = None, batch_size: int = 64,
+        track_visited: bool = False) -> PathfindingResult:
     """
     Depth-First Search algorithm.
     
@@ -83,7 +166,12 @@ def dfs(grid: Grid, start: Tuple[int, int], end: Tuple[int, int],
         grid: Grid instance
         start: Start position (row, col)
         end: End position (row, col)
-        on_visit: Optional callback function called when visiting a node
+        on_visit: Optional callback, called with a list of the (row, col)
+            positions visited since its last call (every batch_size nodes,
+            and once more when the search ends)
+        batch_size: How many visited nodes to collect per on_visit call
+        track_visited: Fill in result.visited (every node reached, in order);
+            off by default since most callers only need the path
         
     Returns:
         PathfindingResult object
@@ -93,39 +181,40 @@ def dfs(grid: Grid, start: Tuple[int, int], end: Tuple[int, int],
     if not grid.is_valid(*start) or not grid.is_valid(*end):
         return result
     
-    stack = [start]
-    visited = {start}
-    parent = {start: None}
+    passable, width = _passable_map(grid)
+    start_id = (start[0] + 1) * width + start[1] + 1
+    end_id = (end[0] + 1) * width + end[1] + 1
+    offsets = (1, width, -1, -width)  # right, down, left, up
+    
+    stack = [start_id]
+    passable[start_id] = 0  # Visited
+    parent = {start_id: None}  # Also: every node reached
+    exploring = []
+    visited_order = []
+    reported = 0  # How many of exploring have been passed to on_visit
     
     while stack:
         current = stack.pop()
-        result.exploring.append(current)
+        exploring.append(current)
         
-        if on_visit:
-            on_visit(current)
+        if on_visit and len(exploring) - reported >= batch_size:
+            reported = _report_visits(on_visit, exploring, reported, width)
         
-        if current == end:
-            # Reconstruct path
-            path = []
-            node = end
-            while node is not None:
-                path.append(node)
-                node = parent[node]
-            result.path = path[::-1]
-            result.found = True
-            result.path_length = len(result.path) - 1
-            result.nodes_explored = len(visited)
-            return result
+        if current == end_id:
+            return _finish(result, width, exploring, visited_order,
+                           _build_path(parent, end_id), len(parent), on_visit, reported)
         
-        for neighbor in grid.get_neighbors(*current):
-            if neighbor not in visited:
-                visited.add(neighbor)
+        for offset in offsets:
+            neighbor = current + offset
+            if passable[neighbor]:
+                passable[neighbor] = 0
                 parent[neighbor] = current
                 stack.append(neighbor)
-                result.visited.append(neighbor)
+                if track_visited:
+                    visited_order.append(neighbor)
     
-    result.nodes_explored = len(visited)
-    return result
+    return _finish(result, width, exploring, visited_order, None, len(parent),
+                   on_visit, reported)
 
 
 def heuristic(row1: int, col1: int, row2: int, col2: int) -> float:
@@ -143,7 +232,8 @@ def heuristic(row1: int, col1: int, row2: int, col2: int) -> float:
 
 
 def astar(grid: Grid, start: Tuple[int, int], end: Tuple[int, int],
-          on_visit: Optional[Callable] = None) -> PathfindingResult:
+          on_visit: Optional[Callable] = None, batch_size: int = 64,
+          track_visited: bool = False) -> PathfindingResult:
     """
     A* (A-Star) algorithm with Manhattan distance heuristic.
     
@@ -151,7 +241,12 @@ def astar(grid: Grid, start: Tuple[int, int], end: Tuple[int, int],
         grid: Grid instance
         start: Start position (row, col)
         end: End position (row, col)
-        on_visit: Optional callback function called when visiting a node
+        on_visit: Optional callback, called with a list of the (row, col)
+            positions visited since its last call (every batch_size nodes,
+            and once more when the search ends)
+        batch_size: How many visited nodes to collect per on_visit call
+        track_visited: Fill in result.visited (every node reached, in order);
+            off by default since most callers only need the path
         
     Returns:
         PathfindingResult object
@@ -161,57 +256,76 @@ def astar(grid: Grid, start: Tuple[int, int], end: Tuple[int, int],
     if not grid.is_valid(*start) or not grid.is_valid(*end):
         return result
     
-    open_set = [(0, start)]  # (f_score, position)
-    came_from: Dict[Tuple[int, int], Optional[Tuple[int, int]]] = {start: None}
-    g_score: Dict[Tuple[int, int], float] = {start: 0}
-    f_score: Dict[Tuple[int, int], float] = {start: heuristic(*start, *end)}
-    visited_set = set()
+    passable, width = _passable_map(grid)
+    start_id = (start[0] + 1) * width + start[1] + 1
+    end_id = (end[0] + 1) * width + end[1] + 1
+    end_row, end_col = divmod(end_id, width)
+    offsets = (1, width, -1, -width)  # right, down, left, up
     
-    while open_set:
-        current_f, current = heapq.heappop(open_set)
-        
-        if current in visited_set:
+    # Bucket queue: f scores are small ints and (the heuristic being
+    # consistent) the smallest f never goes down, so the open set is one
+    # bucket per f, walked upwards. Each bucket is a heap of plain node ids;
+    # ids grow with (row, col), so ties in f break the same way
+    # (f, (row, col)) tuples in a single heap would.
+    current_f = heuristic(*start, *end)
+    buckets: Dict[int, List[int]] = {current_f: [start_id]}
+    open_count = 1  # Entries across all buckets
+    came_from: Dict[int, Optional[int]] = {start_id: None}
+    g_score: Dict[int, float] = {start_id: 0}
+    exploring = []  # Also: every node closed
+    visited_order = []
+    reported = 0  # How many of exploring have been passed to on_visit
+    visited_added = set()  # Members of visited_order, for O(1) lookups
+    
+    while open_count:
+        bucket = buckets.get(current_f)
+        if not bucket:
+            buckets.pop(current_f, None)
+            current_f += 1
             continue
+        current = heapq.heappop(bucket)
+        open_count -= 1
         
-        visited_set.add(current)
-        result.exploring.append(current)
+        if not passable[current]:
+            continue  # Already closed
         
-        if on_visit:
-            on_visit(current)
+        passable[current] = 0  # Closed
+        exploring.append(current)
         
-        if current == end:
-            # Reconstruct path
-            path = []
-            node = end
-            while node is not None:
-                path.append(node)
-                node = came_from[node]
-            result.path = path[::-1]
-            result.found = True
-            result.path_length = len(result.path) - 1
-            result.nodes_explored = len(visited_set)
-            return result
+        if on_visit and len(exploring) - reported >= batch_size:
+            reported = _report_visits(on_visit, exploring, reported, width)
         
-        for neighbor in grid.get_neighbors(*current):
-            if neighbor in visited_set:
-                continue
-            
-            tentative_g = g_score[current] + 1
+        if current == end_id:
+            return _finish(result, width, exploring, visited_order,
+                           _build_path(came_from, end_id), len(exploring), on_visit, reported)
+        
+        tentative_g = g_score[current] + 1
+        for offset in offsets:
+            neighbor = current + offset
+            if not passable[neighbor]:
+                continue  # Wall or closed
             
             if neighbor not in g_score or tentative_g < g_score[neighbor]:
                 came_from[neighbor] = current
                 g_score[neighbor] = tentative_g
-                f_score[neighbor] = tentative_g + heuristic(*neighbor, *end)
-                heapq.heappush(open_set, (f_score[neighbor], neighbor))
-                if neighbor not in result.visited:
-                    result.visited.append(neighbor)
+                row, col = divmod(neighbor, width)
+                f = tentative_g + abs(row - end_row) + abs(col - end_col)
+                if f in buckets:
+                    heapq.heappush(buckets[f], neighbor)
+                else:
+                    buckets[f] = [neighbor]
+                open_count += 1
+                if track_visited and neighbor not in visited_added:
+                    visited_added.add(neighbor)
+                    visited_order.append(neighbor)
     
-    result.nodes_explored = len(visited_set)
-    return result
+    return _finish(result, width, exploring, visited_order, None, len(exploring),
+                   on_visit, reported)
 
 
 def dijkstra(grid: Grid, start: Tuple[int, int], end: Tuple[int, int],
-             on_visit: Optional[Callable] = None) -> PathfindingResult:
+             on_visit: Optional[Callable] = None, batch_size: int = 64,
+             track_visited: bool = False) -> PathfindingResult:
     """
     Dijkstra's algorithm (all edges have weight 1 in this implementation).
     
@@ -219,7 +333,12 @@ def dijkstra(grid: Grid, start: Tuple[int, int], end: Tuple[int, int],
         grid: Grid instance
         start: Start position (row, col)
         end: End position (row, col)
-        on_visit: Optional callback function called when visiting a node
+        on_visit: Optional callback, called with a list of the (row, col)
+            positions visited since its last call (every batch_size nodes,
+            and once more when the search ends)
+        batch_size: How many visited nodes to collect per on_visit call
+        track_visited: Fill in result.visited (every node reached, in order);
+            off by default since most callers only need the path
         
     Returns:
         PathfindingResult object
@@ -229,51 +348,48 @@ def dijkstra(grid: Grid, start: Tuple[int, int], end: Tuple[int, int],
     if not grid.is_valid(*start) or not grid.is_valid(*end):
         return result
     
-    distances: Dict[Tuple[int, int], float] = {start: 0}
-    parent: Dict[Tuple[int, int], Optional[Tuple[int, int]]] = {start: None}
-    pq = [(0, start)]
-    visited = set()
+    passable, width = _passable_map(grid)
+    start_id = (start[0] + 1) * width + start[1] + 1
+    end_id = (end[0] + 1) * width + end[1] + 1
+    offsets = (1, width, -1, -width)  # right, down, left, up
     
-    while pq:
-        current_dist, current = heapq.heappop(pq)
-        
-        if current in visited:
-            continue
-        
-        visited.add(current)
-        result.exploring.append(current)
-        
-        if on_visit:
-            on_visit(current)
-        
-        if current == end:
-            # Reconstruct path
-            path = []
-            node = end
-            while node is not None:
-                path.append(node)
-                node = parent[node]
-            result.path = path[::-1]
-            result.found = True
-            result.path_length = len(result.path) - 1
-            result.nodes_explored = len(visited)
-            return result
-        
-        for neighbor in grid.get_neighbors(*current):
-            if neighbor in visited:
-                continue
+    # With every edge weighing 1, nodes come off the priority queue one
+    # distance at a time, lowest (row, col) first within a distance. Going
+    # level by level and sorting each level gives that same order with no
+    # heap at all (node ids grow with (row, col)).
+    parent: Dict[int, Optional[int]] = {start_id: None}
+    passable[start_id] = 0  # Reached
+    level = [start_id]
+    exploring = []  # Also: every node popped
+    visited_order = []
+    reported = 0  # How many of exploring have been passed to on_visit
+    
+    while level:
+        level.sort()
+        next_level = []
+        for current in level:
+            exploring.append(current)
             
-            new_dist = current_dist + 1  # All edges have weight 1
+            if on_visit and len(exploring) - reported >= batch_size:
+                reported = _report_visits(on_visit, exploring, reported, width)
             
-            if neighbor not in distances or new_dist < distances[neighbor]:
-                distances[neighbor] = new_dist
-                parent[neighbor] = current
-                heapq.heappush(pq, (new_dist, neighbor))
-                if neighbor not in result.visited:
-                    result.visited.append(neighbor)
+            if current == end_id:
+                return _finish(result, width, exploring, visited_order,
+                               _build_path(parent, end_id), len(exploring), on_visit, reported)
+            
+            # The first time a node is reached is already its shortest distance
+            for offset in offsets:
+                neighbor = current + offset
+                if passable[neighbor]:
+                    passable[neighbor] = 0
+                    parent[neighbor] = current
+                    next_level.append(neighbor)
+                    if track_visited:
+                        visited_order.append(neighbor)
+        level = next_level
     
-    result.nodes_explored = len(visited)
-    return result
+    return _finish(result, width, exploring, visited_order, None, len(exploring),
+                   on_visit, reported)
 
 
 def get_algorithm(name: str):
@@ -3,7 +3,7 @@ Grid data structure for pathfinding visualization.
 """
 
 from enum import Enum
-from typing import List, Tuple, Optional, Set
+from typing import List, Tuple, Optional
 import random
 
 
@@ -18,8 +18,31 @@ class CellType(Enum):
     EXPLORING = 6
 
 
+# Neighbor offsets, built once rather than on every get_neighbors call
+_DIRECTIONS_4 = ((0, 1), (1, 0), (0, -1), (-1, 0))
+_DIRECTIONS_8 = _DIRECTIONS_4 + ((1, 1), (1, -1), (-1, 1), (-1, -1))
+
+# CellType for each stored byte (the values are 0..6 in order)
+_CELL_TYPES = tuple(CellType)
+
+_EMPTY, _WALL, _START, _END = (CellType.EMPTY.value, CellType.WALL.value,
+                               CellType.START.value, CellType.END.value)
+
+# bytes.translate tables for the bulk clears
+_CLEAR_PATH_TABLE = bytes(_EMPTY if value in (CellType.VISITED.value, CellType.PATH.value,
+                                              CellType.EXPLORING.value) else value
+                          for value in range(256))
+_CLEAR_WALLS_TABLE = bytes(_EMPTY if value == _WALL else value for value in range(256))
+
+
 class Grid:
-    """Grid class for pathfinding visualization."""
+    """
+    Grid class for pathfinding visualization.
+    
+    The cells live in one flat bytearray, `cells`, holding the CellType
+    value of cell (row, col) at index row * cols + col. `grid` offers the
+    same cells as rows of CellType members.
+    """
     
     def __init__(self, rows: int, cols: int):
         """
@@ -31,57 +54,72 @@ class Grid:
         """
         self.rows = rows
         self.cols = cols
-        self.grid = [[CellType.EMPTY for _ in range(cols)] for _ in range(rows)]
+        self.cells = bytearray(rows * cols)  # All EMPTY
         self.start_pos: Optional[Tuple[int, int]] = None
         self.end_pos: Optional[Tuple[int, int]] = None
     
+    @property
+    def grid(self) -> List[List[CellType]]:
+        """The cells as a 2D list of CellType (a copy; edit through set_cell)."""
+        cols = self.cols
+        cell_type = _CELL_TYPES.__getitem__
+        return [list(map(cell_type, self.cells[row * cols:(row + 1) * cols]))
+                for row in range(self.rows)]
+    
+    @grid.setter
+    def grid(self, rows: List[List[CellType]]):
+        self.cells[:] = bytes(cell.value for row in rows for cell in row)
+    
     def get_cell(self, row: int, col: int) -> CellType:
         """Get cell type at position."""
         if 0 <= row < self.rows and 0 <= col < self.cols:
-            return self.grid[row][col]
+            return _CELL_TYPES[self.cells[row * self.cols + col]]
         return CellType.WALL
     
     def set_cell(self, row: int, col: int, cell_type: CellType):
         """Set cell type at position."""
         if 0 <= row < self.rows and 0 <= col < self.cols:
+            cells, cols = self.cells, self.cols
+            index = row * cols + col
             # Don't overwrite start/end positions
             if cell_type == CellType.WALL:
-                if self.grid[row][col] == CellType.START:
+                if cells[index] == _START:
                     self.start_pos = None
-                elif self.grid[row][col] == CellType.END:
+                elif cells[index] == _END:
                     self.end_pos = None
-                self.grid[row][col] = CellType.WALL
+                cells[index] = _WALL
             elif cell_type == CellType.START:
                 # Clear old start position
                 if self.start_pos:
                     old_row, old_col = self.start_pos
-                    if self.grid[old_row][old_col] == CellType.START:
-                        self.grid[old_row][old_col] = CellType.EMPTY
+                    if cells[old_row * cols + old_col] == _START:
+                        cells[old_row * cols + old_col] = _EMPTY
                 self.start_pos = (row, col)
-                if self.grid[row][col] != CellType.END:
-                    self.grid[row][col] = CellType.START
+                if cells[index] != _END:
+                    cells[index] = _START
             elif cell_type == CellType.END:
                 # Clear old end position
                 if self.end_pos:
                     old_row, old_col = self.end_pos
-                    if self.grid[old_row][old_col] == CellType.END:
-                        self.grid[old_row][old_col] = CellType.EMPTY
+                    if cells[old_row * cols + old_col] == _END:
+                        cells[old_row * cols + old_col] = _EMPTY
                 self.end_pos = (row, col)
-            if self.grid[row][col] != CellType.START and self.grid[row][col] != CellType.END:
-                self.grid[row][col] = cell_type
+            if cells[index] != _START and cells[index] != _END:
+                cells[index] = cell_type.value
     
     def toggle_wall(self, row: int, col: int):
         """Toggle wall at position."""
-        if self.grid[row][col] == CellType.WALL:
-            self.grid[row][col] = CellType.EMPTY
-        elif self.grid[row][col] == CellType.EMPTY:
-            self.grid[row][col] = CellType.WALL
+        index = row * self.cols + col
+        if self.cells[index] == _WALL:
+            self.cells[index] = _EMPTY
+        elif self.cells[index] == _EMPTY:
+            self.cells[index] = _WALL
     
     def is_valid(self, row: int, col: int) -> bool:
         """Check if position is valid and not a wall."""
         return (0 <= row < self.rows and 
                 0 <= col < self.cols and 
-                self.grid[row][col] != CellType.WALL)
+                self.cells[row * self.cols + col] != _WALL)
     
     def get_neighbors(self, row: int, col: int, diagonal: bool = False) -> List[Tuple[int, int]]:
         """
@@ -96,70 +134,72 @@ class Grid:
             List of (row, col) tuples
         """
         neighbors = []
-        directions = [(0, 1), (1, 0), (0, -1), (-1, 0)]  # 4-directional
-        
-        if diagonal:
-            directions.extend([(1, 1), (1, -1), (-1, 1), (-1, -1)])  # 8-directional
+        directions = _DIRECTIONS_8 if diagonal else _DIRECTIONS_4
+        rows, cols, cells = self.rows, self.cols, self.cells
         
+        # Same test as is_valid, inlined: this runs for every expanded node
         for dr, dc in directions:
             new_row, new_col = row + dr, col + dc
-            if self.is_valid(new_row, new_col):
+            if 0 <= new_row < rows and 0 <= new_col < cols and cells[new_row * cols + new_col] != _WALL:
                 neighbors.append((new_row, new_col))
         
         return neighbors
     
     def clear_path(self):
         """Clear path and visited cells, keep walls, start, and end."""
-        for row in range(self.rows):
-            for col in range(self.cols):
-                if self.grid[row][col] in [CellType.VISITED, CellType.PATH, CellType.EXPLORING]:
-                    self.grid[row][col] = CellType.EMPTY
+        self.cells[:] = self.cells.translate(_CLEAR_PATH_TABLE)
     
     def clear_all(self):
         """Clear everything including walls."""
-        self.grid = [[CellType.EMPTY for _ in range(self.cols)] for _ in range(self.rows)]
+        self.cells[:] = bytes(len(self.cells))
         self.start_pos = None
         self.end_pos = None
     
     def clear_walls(self):
         """Clear only walls, keep start and end."""
-        for row in range(self.rows):
-            for col in range(self.cols):
-                if self.grid[row][col] == CellType.WALL:
-                    self.grid[row][col] = CellType.EMPTY
+        self.cells[:] = self.cells.translate(_CLEAR_WALLS_TABLE)
     
     def generate_maze_dfs(self):
-        """Generate a maze using DFS algorithm."""
+        """
+        Generate a maze using DFS algorithm.
+        
+        The depth-first walk uses an explicit stack instead of recursion, so
+        large grids can't hit the recursion limit.
+        """
         self.clear_all()
+        rows, cols = self.rows, self.cols
         
         # Initialize all cells as walls
-        for row in range(self.rows):
-            for col in range(self.cols):
-                self.grid[row][col] = CellType.WALL
+        wall, empty = _WALL, _EMPTY
+        cells = self.cells
+        cells[:] = bytes([wall]) * (rows * cols)
         
         # Start from (1, 1) - must be odd coordinates
         start_row, start_col = 1, 1
         
-        def carve_path(row: int, col: int, visited: Set[Tuple[int, int]]):
-            """Recursive DFS to carve maze paths."""
-            visited.add((row, col))
-            self.grid[row][col] = CellType.EMPTY
-            
-            # Randomize directions
+        def visit(row: int, col: int) -> tuple:
+            """Carve a cell and return its stack entry (randomized directions)."""
+            cells[row * cols + col] = empty
             directions = [(0, 2), (2, 0), (0, -2), (-2, 0)]
             random.shuffle(directions)
-            
+            return row, col, iter(directions)
+        
+        # Each entry is a cell plus the directions it still has to try;
+        # a cell is only carved once, so carved means visited
+        stack = [visit(start_row, start_col)]
+        while stack:
+            row, col, directions = stack[-1]
             for dr, dc in directions:
                 new_row, new_col = row + dr, col + dc
-                if (0 < new_row < self.rows - 1 and 
-                    0 < new_col < self.cols - 1 and 
-                    (new_row, new_col) not in visited):
+                if (0 < new_row < rows - 1 and
+                    0 < new_col < cols - 1 and
+                    cells[new_row * cols + new_col] == wall):
                     # Carve the wall between current and new cell
-                    mid_row, mid_col = row + dr // 2, col + dc // 2
-                    self.grid[mid_row][mid_col] = CellType.EMPTY
-                    carve_path(new_row, new_col, visited)
-        
-        carve_path(start_row, start_col, set())
+                    cells[(row + dr // 2) * cols + col + dc // 2] = empty
+                    stack.append(visit(new_row, new_col))
+                    break
+            else:
+                stack.pop()  # Every direction tried: backtrack
         
         # Set start and end positions
         if self.rows > 2 and self.cols > 2:
@@ -168,10 +208,5 @@ class Grid:
     
     def get_wall_count(self) -> int:
         """Get number of walls in the grid."""
-        count = 0
-        for row in range(self.rows):
-            for col in range(self.cols):
-                if self.grid[row][col] == CellType.WALL:
-                    count += 1
-        return count
+        return self.cells.count(_WALL)
 
@@ -6,7 +6,8 @@ A comprehensive GUI application for visualizing pathfinding algorithms.
 import pygame
 import sys
 import time
-from typing import Optional, Tuple, List
+from collections import deque
+from typing import Deque, Optional, Set, Tuple, List
 from grid import Grid, CellType
 from algorithms import get_algorithm, PathfindingResult
 
@@ -57,6 +58,18 @@ COLOR_SCHEMES = {
     }
 }
 
+# Color-scheme key for each CellType value (index = value)
+CELL_COLOR_KEYS = ('empty', 'wall', 'start', 'end', 'visited', 'path', 'exploring')
+
+# Cell codes an overlay may paint over: the path beats visited, visited
+# beats exploring, and walls, start and end always show through
+_PATH_OVER = bytes([CellType.EMPTY.value, CellType.EXPLORING.value, CellType.VISITED.value])
+_VISITED_OVER = bytes([CellType.EMPTY.value, CellType.EXPLORING.value])
+_EXPLORING_OVER = bytes([CellType.EMPTY.value])
+
+# Events after which the window may have lost its contents and needs a full repaint
+_EXPOSE_EVENTS = (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED, pygame.WINDOWRESTORED)
+
 
 class Button:
     """Button widget for GUI."""
@@ -70,6 +83,7 @@ class Button:
         self.hovered = False
         self.pressed = False
         self.press_timer = 0
+        self._text_surface: Optional[pygame.Surface] = None  # Rendered on first draw
     
     def draw(self, screen: pygame.Surface):
         """Draw the button."""
@@ -94,7 +108,9 @@ class Button:
         
         # Adjust text position when pressed
         text_offset = (1, 1) if self.pressed else (0, 0)
-        text_surface = self.font.render(self.text, True, self.colors['text'])
+        if self._text_surface is None:
+            self._text_surface = self.font.render(self.text, True, self.colors['text']).convert_alpha()
+        text_surface = self._text_surface
         text_rect = text_surface.get_rect(center=(draw_rect.centerx + text_offset[0], 
                                                    draw_rect.centery + text_offset[1]))
         screen.blit(text_surface, text_rect)
@@ -106,6 +122,11 @@ class Button:
                 self.pressed = False
                 self.press_timer = 0
     
+    def set_colors(self, colors: dict):
+        """Switch to another color scheme (the label is re-rendered on next draw)."""
+        self.colors = colors
+        self._text_surface = None
+    
     def check_hover(self, pos: Tuple[int, int]):
         """Check if mouse is hovering over button."""
         self.hovered = self.rect.collidepoint(pos)
@@ -168,19 +189,36 @@ class PathfindingVisualizer:
         self.is_visualizing = False
         self.visualization_speed = 5  # Steps per frame (higher = faster)
         self.result: Optional[PathfindingResult] = None
-        self.visited_cells: List[Tuple[int, int]] = []
-        self.path_cells: List[Tuple[int, int]] = []
-        self.exploring_cells: List[Tuple[int, int]] = []
+        # Sets for O(1) membership tests; exploring cells also need FIFO order
+        self.visited_cells: Set[Tuple[int, int]] = set()
+        self.path_cells: Set[Tuple[int, int]] = set()
+        self.exploring_cells: Deque[Tuple[int, int]] = deque()
         
         # Color scheme
         self.color_scheme = 'default'
         self.colors = COLOR_SCHEMES[self.color_scheme]
+        self._palettes = {}  # Scheme name -> (red, green, blue) translate tables
+        self._small_pixels = None  # One RGB pixel per cell, see draw_grid
+        self._small_image = None
+        self._grid_surface = None  # Full-size grid image reused by draw_grid
+        self._grid_lines = None  # Cached cell-gap overlay for draw_grid
+        self._grid_lines_key = None
+        self._tiles = {}  # Per-color cell tiles for _draw_dirty_cells
+        self._tiles_key = None
+        self._panel_bg = None  # Static panel chrome, see _panel_background
+        self._panel_bg_key = None
+        
+        # Redraw bookkeeping: draw() repaints only what these say changed
+        self._full_redraw = True  # Everything (layout, colors or many cells changed)
+        self._panel_dirty = True  # The control panel
+        self._dirty_cells = set()  # Individual grid cells, as (row, col)
         
         # Fonts
         self.font_small = pygame.font.Font(None, 20)
         self.font_medium = pygame.font.Font(None, 24)
         self.font_large = pygame.font.Font(None, 32)
         self.font_title = pygame.font.Font(None, 36)
+        self._text_cache = {}  # (font id, text, color) -> rendered Surface, see _text
         
         # UI state
         self.drawing_walls = False
@@ -193,6 +231,7 @@ class PathfindingVisualizer:
             'nodes_explored': 0,
             'execution_time': 0.0
         }
+        self._stat_lines: List[str] = []  # stats formatted for the panel
         
         # Create buttons
         self.create_buttons()
@@ -211,6 +250,7 @@ class PathfindingVisualizer:
         self.WINDOW_WIDTH, self.WINDOW_HEIGHT = size
         self.screen = pygame.display.set_mode((self.WINDOW_WIDTH, self.WINDOW_HEIGHT), pygame.RESIZABLE)
         self.update_cell_size()
+        self.invalidate_all()
     
     def resize_grid(self, size: str):
         """Resize the grid."""
@@ -219,8 +259,11 @@ class PathfindingVisualizer:
             old_start = self.grid.start_pos
             old_end = self.grid.end_pos
             
-            # Create new grid
-            self.grid = Grid(rows, cols)
+            # Reuse the grid's buffer when the size is unchanged, else create a new grid
+            if (rows, cols) == (self.grid.rows, self.grid.cols):
+                self.grid.clear_all()
+            else:
+                self.grid = Grid(rows, cols)
             self.grid_rows = rows
             self.grid_cols = cols
             self.current_grid_size = size
@@ -242,6 +285,7 @@ class PathfindingVisualizer:
             self.path_cells.clear()
             self.exploring_cells.clear()
             self.result = None
+            self.invalidate_all()
     
     def create_buttons(self):
         """Create UI buttons."""
@@ -258,6 +302,8 @@ class PathfindingVisualizer:
                 alg.upper(), self.colors, self.font_small
             )
             button_y += button_height + button_spacing
+        self._alg_buttons = [self.buttons[f'alg_{alg}'] for alg in self.algorithms]
+        self._current_alg_button = self.buttons[f'alg_{self.current_algorithm}']
         
         # Control buttons (start after algorithms with spacing)
         control_start_y = button_y + section_spacing
@@ -300,6 +346,13 @@ class PathfindingVisualizer:
             'grid': grid_start_y - 20
         }
     
+    def set_color_scheme(self, name: str):
+        """Switch color scheme, recoloring the existing buttons in place."""
+        self.color_scheme = name
+        self.colors = COLOR_SCHEMES[name]
+        for button in self.buttons.values():
+            button.set_colors(self.colors)
+    
     def get_grid_pos(self, mouse_pos: Tuple[int, int]) -> Optional[Tuple[int, int]]:
         """Convert mouse position to grid coordinates."""
         x, y = mouse_pos
@@ -317,132 +370,188 @@ class PathfindingVisualizer:
         return None
     
     def draw_grid(self):
-        """Draw the grid."""
-        grid_surface = pygame.Surface((
-            self.grid_cols * self.cell_size,
-            self.grid_rows * self.cell_size
-        ))
-        grid_surface.fill(self.colors['background'])
-        
-        for row in range(self.grid_rows):
-            for col in range(self.grid_cols):
-                cell_type = self.grid.get_cell(row, col)
-                x = col * self.cell_size
-                y = row * self.cell_size
-                rect = pygame.Rect(x, y, self.cell_size - 1, self.cell_size - 1)
-                
-                # Determine color based on cell type
-                if cell_type == CellType.WALL:
-                    color = self.colors['wall']
-                elif cell_type == CellType.START:
-                    color = self.colors['start']
-                elif cell_type == CellType.END:
-                    color = self.colors['end']
-                elif cell_type == CellType.PATH or (row, col) in self.path_cells:
-                    color = self.colors['path']
-                elif cell_type == CellType.VISITED or (row, col) in self.visited_cells:
-                    color = self.colors['visited']
-                elif cell_type == CellType.EXPLORING or (row, col) in self.exploring_cells:
-                    color = self.colors['exploring']
-                else:
-                    color = self.colors['empty']
-                
-                pygame.draw.rect(grid_surface, color, rect)
-        
+        """
+        Draw the grid.
+        
+        Each cell becomes one pixel of a small image whose colors come from
+        a palette lookup done in C (bytes.translate); pygame then scales it
+        up to full size in one call and a cached overlay adds the 1-pixel
+        gaps between cells. There are no per-cell drawing calls.
+        """
+        rows, cols, cell_size = self.grid_rows, self.grid_cols, self.cell_size
+        codes = self._cell_codes()
+        red, green, blue = self._palette()
+        
+        # The small image wraps a bytearray kept between frames, so filling
+        # the buffer in place updates the image without allocating either
+        if self._small_image is None or self._small_image.get_size() != (cols, rows):
+            self._small_pixels = bytearray(3 * rows * cols)
+            self._small_image = pygame.image.frombuffer(self._small_pixels, (cols, rows), 'RGB')
+        rgb, small = self._small_pixels, self._small_image
+        rgb[0::3] = codes.translate(red)
+        rgb[1::3] = codes.translate(green)
+        rgb[2::3] = codes.translate(blue)
+        
+        # Scale into the same full-size surface every frame instead of a new one
+        size = (cols * cell_size, rows * cell_size)
+        grid_surface = self._grid_surface
+        if grid_surface is None or grid_surface.get_size() != size:
+            grid_surface = self._grid_surface = pygame.Surface(size, 0, small)
+        pygame.transform.scale(small, size, grid_surface)
+        grid_surface.blit(self._cell_gaps(), (0, 0))
         self.screen.blit(grid_surface, (self.GRID_X_OFFSET, self.GRID_Y_OFFSET))
     
-    def draw_panel(self):
-        """Draw the control panel."""
-        panel_rect = pygame.Rect(0, 0, self.PANEL_WIDTH, self.WINDOW_HEIGHT)
-        pygame.draw.rect(self.screen, self.colors['panel'], panel_rect)
-        pygame.draw.line(self.screen, self.colors['text'], 
+    def _cell_codes(self) -> bytearray:
+        """
+        Get the grid as one byte per cell (row by row), holding the CellType
+        value to draw, with the animation's path/visited/exploring cells
+        stamped on top.
+        """
+        cols = self.grid_cols
+        codes = bytearray(self.grid.cells)
+        
+        # Lowest priority first, so a later overlay can paint over an earlier one
+        for cells, cell_type, paints_over in (
+                (self.exploring_cells, CellType.EXPLORING, _EXPLORING_OVER),
+                (self.visited_cells, CellType.VISITED, _VISITED_OVER),
+                (self.path_cells, CellType.PATH, _PATH_OVER)):
+            code = cell_type.value
+            for row, col in cells:
+                index = row * cols + col
+                if codes[index] in paints_over:
+                    codes[index] = code
+        return codes
+    
+    def _palette(self) -> Tuple[bytes, bytes, bytes]:
+        """Get the color scheme's per-channel translate tables (cell code -> byte)."""
+        palette = self._palettes.get(self.color_scheme)
+        if palette is None:
+            colors = [self.colors[key] for key in CELL_COLOR_KEYS]
+            palette = tuple(bytes(color[channel] for color in colors) + bytes(256 - len(colors))
+                            for channel in range(3))
+            self._palettes[self.color_scheme] = palette
+        return palette
+    
+    def _cell_gaps(self) -> pygame.Surface:
+        """
+        Get the overlay that draws the background-colored line along the
+        right and bottom edge of every cell (colorkeyed everywhere else).
+        Rebuilt only when the grid size, cell size or colors change.
+        """
+        rows, cols, cell_size = self.grid_rows, self.grid_cols, self.cell_size
+        background = self.colors['background']
+        key = (rows, cols, cell_size, background)
+        if self._grid_lines_key != key:
+            width, height = cols * cell_size, rows * cell_size
+            transparent = (0, 0, 0) if background != (0, 0, 0) else (255, 255, 255)
+            lines = pygame.Surface((width, height)).convert()
+            lines.fill(transparent)
+            lines.set_colorkey(transparent)
+            for col in range(cols):
+                x = col * cell_size + cell_size - 1
+                pygame.draw.line(lines, background, (x, 0), (x, height - 1))
+            for row in range(rows):
+                y = row * cell_size + cell_size - 1
+                pygame.draw.line(lines, background, (0, y), (width - 1, y))
+            self._grid_lines = lines
+            self._grid_lines_key = key
+        return self._grid_lines
+    
+    def _text(self, font: pygame.font.Font, text: str) -> pygame.Surface:
+        """Render text in the current text color, reusing earlier renders."""
+        key = (id(font), text, self.colors['text'])
+        surface = self._text_cache.get(key)
+        if surface is None:
+            if len(self._text_cache) >= 256:  # Old stats and color schemes pile up
+                self._text_cache.clear()
+            surface = self._text_cache[key] = font.render(text, True, self.colors['text']).convert_alpha()
+        return surface
+    
+    def _panel_background(self) -> pygame.Surface:
+        """
+        Get the panel's static parts (fill, separator line, title, section
+        labels and instructions) as one surface, rebuilt only when the window
+        height, color scheme or number of stats lines change.
+        """
+        stat_count = len(self._stat_lines) if self.result else 0
+        key = (self.WINDOW_HEIGHT, self.color_scheme, stat_count)
+        if self._panel_bg_key == key:
+            return self._panel_bg
+        
+        # Wide enough for the 2-pixel separator line
+        surface = pygame.Surface((self.PANEL_WIDTH + 2, self.WINDOW_HEIGHT)).convert()
+        surface.fill(self.colors['background'])
+        pygame.draw.rect(surface, self.colors['panel'], (0, 0, self.PANEL_WIDTH, self.WINDOW_HEIGHT))
+        pygame.draw.line(surface, self.colors['text'], 
                         (self.PANEL_WIDTH, 0), (self.PANEL_WIDTH, self.WINDOW_HEIGHT), 2)
         
-        # Title
-        title = self.font_title.render("Pathfinding Visualizer", True, self.colors['text'])
-        self.screen.blit(title, (10, 10))
+        # Title and section labels
+        surface.blit(self._text(self.font_title, "Pathfinding Visualizer"), (10, 10))
+        for label, position in (("Algorithm:", 'algorithm'), ("Controls:", 'controls'),
+                                ("Color Scheme:", 'color'), ("Grid Size:", 'grid')):
+            surface.blit(self._text(self.font_medium, label), (10, self.label_positions[position]))
         
-        # Algorithm selection
-        alg_text = self.font_medium.render("Algorithm:", True, self.colors['text'])
-        self.screen.blit(alg_text, (10, self.label_positions['algorithm']))
+        # Statistics (positioned after grid buttons with spacing)
+        stats_y = self.label_positions['grid'] + 60
+        surface.blit(self._text(self.font_medium, "Statistics:"), (10, stats_y))
         
-        # Draw algorithm buttons
-        for i, alg in enumerate(self.algorithms):
-            button = self.buttons[f'alg_{alg}']
-            if alg == self.current_algorithm:
-                # Highlight selected algorithm
-                pygame.draw.rect(self.screen, self.colors['path'], button.rect, 3)
+        # Instructions (positioned after statistics with spacing)
+        instructions_y = stats_y + 30 + 25 * stat_count + 100
+        surface.blit(self._text(self.font_medium, "Instructions:"), (10, instructions_y))
+        
+        instructions = [
+            "Left Click: Draw walls",
+            "Right Click: Set start",
+            "Middle Click: Set end",
+            "Space: Start visualization",
+            "C: Clear path",
+            "R: Reset grid",
+            "M: Generate maze"
+        ]
+        
+        instructions_y += 30
+        for inst in instructions:
+            surface.blit(self._text(self.font_small, inst), (10, instructions_y))
+            instructions_y += 20
+        
+        self._panel_bg = surface
+        self._panel_bg_key = key
+        return surface
+    
+    def draw_panel(self):
+        """Draw the control panel: the cached background, then the parts that change."""
+        self.screen.blit(self._panel_background(), (0, 0))
+        
+        # Highlight selected algorithm, then draw algorithm buttons
+        pygame.draw.rect(self.screen, self.colors['path'], self._current_alg_button.rect, 3)
+        for button in self._alg_buttons:
             button.draw(self.screen)
         
         # Draw control buttons
-        control_text = self.font_medium.render("Controls:", True, self.colors['text'])
-        self.screen.blit(control_text, (10, self.label_positions['controls']))
-        
         for key in ['start', 'clear', 'reset', 'maze', 'clear_walls']:
             self.buttons[key].draw(self.screen)
         
         # Speed control (label above buttons)
-        speed_text = self.font_medium.render(f"Speed: {self.visualization_speed}", True, self.colors['text'])
+        speed_text = self._text(self.font_medium, f"Speed: {self.visualization_speed}")
         self.screen.blit(speed_text, (10, self.label_positions['speed']))
         self.buttons['speed_down'].draw(self.screen)
         self.buttons['speed_up'].draw(self.screen)
         
-        # Color scheme (label above buttons)
-        color_text = self.font_medium.render("Color Scheme:", True, self.colors['text'])
-        self.screen.blit(color_text, (10, self.label_positions['color']))
+        # Color scheme and grid size buttons
         self.buttons['color_default'].draw(self.screen)
         self.buttons['color_dark'].draw(self.screen)
         self.buttons['color_light'].draw(self.screen)
-        
-        # Grid size (label above buttons)
-        grid_text = self.font_medium.render("Grid Size:", True, self.colors['text'])
-        self.screen.blit(grid_text, (10, self.label_positions['grid']))
         self.buttons['grid_small'].draw(self.screen)
         self.buttons['grid_medium'].draw(self.screen)
         self.buttons['grid_large'].draw(self.screen)
         
-        # Statistics (positioned after grid buttons with spacing)
-        stats_y = self.label_positions['grid'] + 60
-        stats_text = self.font_medium.render("Statistics:", True, self.colors['text'])
-        self.screen.blit(stats_text, (10, stats_y))
-        
-        stats_y += 30
+        # Statistics lines
         if self.result:
-            stats = [
-                f"Path Length: {self.stats['path_length']}",
-                f"Nodes Explored: {self.stats['nodes_explored']}",
-                f"Time: {self.stats['execution_time']:.3f}s"
-            ]
-            if not self.result.found:
-                stats.insert(0, "Path: Not Found")
-            else:
-                stats.insert(0, "Path: Found")
-            
-            for stat in stats:
-                stat_surface = self.font_small.render(stat, True, self.colors['text'])
+            stats_y = self.label_positions['grid'] + 90
+            for stat in self._stat_lines:
+                stat_surface = self._text(self.font_small, stat)
                 self.screen.blit(stat_surface, (10, stats_y))
                 stats_y += 25
-        
-        # Instructions (positioned after statistics with spacing)
-        instructions_y = stats_y + 100
-        inst_text = self.font_medium.render("Instructions:", True, self.colors['text'])
-        self.screen.blit(inst_text, (10, instructions_y))
-        
-        instructions = [
-            "Left Click: Draw walls",
-            "Right Click: Set start",
-            "Middle Click: Set end",
-            "Space: Start visualization",
-            "C: Clear path",
-            "R: Reset grid",
-            "M: Generate maze"
-        ]
-        
-        instructions_y += 30
-        for inst in instructions:
-            inst_surface = self.font_small.render(inst, True, self.colors['text'])
-            self.screen.blit(inst_surface, (10, instructions_y))
-            instructions_y += 20
     
     def visualize_algorithm(self):
         """Run the selected algorithm with visualization."""
@@ -454,6 +563,7 @@ class PathfindingVisualizer:
         self.visited_cells.clear()
         self.path_cells.clear()
         self.exploring_cells.clear()
+        self.invalidate_all()
         
         start_time = time.time()
         
@@ -464,19 +574,31 @@ class PathfindingVisualizer:
         self.result = algorithm(
             self.grid,
             self.grid.start_pos,
-            self.grid.end_pos
+            self.grid.end_pos,
+            track_visited=True  # animate_result shows these at the end
         )
         
         end_time = time.time()
         self.stats['execution_time'] = end_time - start_time
         self.stats['path_length'] = self.result.path_length
         self.stats['nodes_explored'] = self.result.nodes_explored
+        self._stat_lines = self._format_stats()  # Once per run, not every frame
+        self._panel_dirty = True
         
         # Animate the result
         self.animate_result()
         
         self.is_visualizing = False
     
+    def _format_stats(self) -> List[str]:
+        """The statistics lines shown in the panel for the current result."""
+        return [
+            "Path: Found" if self.result.found else "Path: Not Found",
+            f"Path Length: {self.stats['path_length']}",
+            f"Nodes Explored: {self.stats['nodes_explored']}",
+            f"Time: {self.stats['execution_time']:.3f}s"
+        ]
+    
     def animate_result(self):
         """Animate the algorithm result."""
         if not self.result:
@@ -491,6 +613,14 @@ class PathfindingVisualizer:
         max_frames = 10000  # Safety limit to prevent infinite loops
         frame_count = 0
         
+        # visualization_speed is cells per 1/60 s of real time, so slow frames
+        # advance further instead of slowing the animation down
+        cells_per_ms = self.visualization_speed * 60 / 1000
+        budget = float(self.visualization_speed)  # Cells owed; first frame gets one frame's worth
+        
+        # Mouse motion is ignored while animating, so don't even queue it
+        pygame.event.set_blocked(pygame.MOUSEMOTION)
+        
         while (frame_count < max_frames and 
                (visited_index < len(self.result.visited) or 
                 exploring_index < len(self.result.exploring) or
@@ -510,41 +640,37 @@ class PathfindingVisualizer:
                         break
                 elif event.type == pygame.VIDEORESIZE:
                     self.handle_resize(event.size)
+                elif event.type in _EXPOSE_EVENTS:
+                    self.invalidate_all()
+            
+            # Each phase advances by a whole slice of cells per frame
+            speed = int(budget)
+            budget -= speed
             
             # Add exploring cells
-            for _ in range(self.visualization_speed):
-                if exploring_index < len(self.result.exploring):
-                    cell = self.result.exploring[exploring_index]
-                    if cell not in self.visited_cells:
-                        self.exploring_cells.append(cell)
-                    exploring_index += 1
-                else:
-                    break
+            new_cells = [cell for cell in self.result.exploring[exploring_index:exploring_index + speed]
+                         if cell not in self.visited_cells]
+            self.exploring_cells.extend(new_cells)
+            self._dirty_cells.update(new_cells)
+            exploring_index = min(exploring_index + speed, len(self.result.exploring))
             
             # Move exploring to visited
-            for _ in range(self.visualization_speed):
-                if self.exploring_cells:
-                    cell = self.exploring_cells.pop(0)
-                    if cell not in self.visited_cells:
-                        self.visited_cells.append(cell)
-                else:
-                    break
+            popleft = self.exploring_cells.popleft
+            moved = [popleft() for _ in range(min(speed, len(self.exploring_cells)))]
+            self.visited_cells.update(moved)
+            self._dirty_cells.update(moved)
             
             # Draw path if found
             if self.result.found:
                 # Check if all visited cells are shown before showing path
                 if exploring_index >= len(self.result.exploring) and not self.exploring_cells:
-                    for _ in range(self.visualization_speed * 2):
-                        if path_index < len(self.result.path):
-                            cell = self.result.path[path_index]
-                            if cell not in self.path_cells:
-                                self.path_cells.append(cell)
-                            path_index += 1
-                        else:
-                            break
+                    new_cells = self.result.path[path_index:path_index + speed * 2]
+                    self.path_cells.update(new_cells)
+                    self._dirty_cells.update(new_cells)
+                    path_index += len(new_cells)
             
             self.draw()
-            clock.tick(60)
+            budget += cells_per_ms * clock.tick(60)
             frame_count += 1
             
             # Check if animation is complete
@@ -557,20 +683,100 @@ class PathfindingVisualizer:
         if self.result:
             for cell in self.result.visited:
                 if cell not in self.visited_cells:
-                    self.visited_cells.append(cell)
+                    self.visited_cells.add(cell)
+                    self._dirty_cells.add(cell)
             if self.result.found:
                 for cell in self.result.path:
                     if cell not in self.path_cells:
-                        self.path_cells.append(cell)
+                        self.path_cells.add(cell)
+                        self._dirty_cells.add(cell)
         
+        pygame.event.set_allowed(pygame.MOUSEMOTION)
         self.draw()
     
+    def invalidate_all(self):
+        """Make the next draw() repaint the whole window."""
+        self._full_redraw = True
+    
     def draw(self):
-        """Draw everything."""
-        self.screen.fill(self.colors['background'])
-        self.draw_grid()
-        self.draw_panel()
-        pygame.display.flip()
+        """
+        Draw whatever changed since the last frame.
+        A full repaint (after a resize, color change, reset...) redraws and
+        flips the whole window; otherwise only the dirty grid cells and, if
+        needed, the panel are drawn and just those rectangles are updated.
+        An idle frame draws nothing at all.
+        """
+        # A pressed button animates for a few frames (and is drawn pressed
+        # once more on the frame its timer runs out), so keep the panel
+        # dirty until the frame after every press has ended
+        pressed = any(button.pressed for button in self.buttons.values())
+        
+        if self._full_redraw:
+            self.screen.fill(self.colors['background'])
+            self.draw_grid()
+            self.draw_panel()
+            pygame.display.flip()
+            self._full_redraw = False
+            self._dirty_cells.clear()
+        else:
+            rects = self._draw_dirty_cells()
+            if self._panel_dirty:
+                self.draw_panel()
+                rects.append(pygame.Rect(0, 0, self.PANEL_WIDTH + 2, self.WINDOW_HEIGHT))
+            if rects:
+                pygame.display.update(rects)
+        
+        self._panel_dirty = pressed
+    
+    def _draw_dirty_cells(self) -> List[pygame.Rect]:
+        """
+        Redraw just the cells in _dirty_cells on screen and return their rects.
+        All of them go out in a single Surface.blits call of pre-filled tiles.
+        """
+        # Everything the loop touches, bound to locals once per call
+        tiles = self._cell_tiles()
+        fixed_tiles = {CellType.WALL.value: tiles['wall'], CellType.START.value: tiles['start'],
+                       CellType.END.value: tiles['end']}
+        path_tile, visited_tile = tiles['path'], tiles['visited']
+        exploring_tile, empty_tile = tiles['exploring'], tiles['empty']
+        path_code, visited_code = CellType.PATH.value, CellType.VISITED.value
+        exploring_code = CellType.EXPLORING.value
+        path_cells, visited_cells = self.path_cells, self.visited_cells
+        exploring_cells = self.exploring_cells
+        cells, cols, cell_size = self.grid.cells, self.grid_cols, self.cell_size
+        x_offset, y_offset = self.GRID_X_OFFSET, self.GRID_Y_OFFSET
+        
+        # Same precedence as draw_grid: walls/start/end, then path, visited, exploring
+        blit_sequence = []
+        for cell in self._dirty_cells:
+            row, col = cell
+            code = cells[row * cols + col]
+            tile = fixed_tiles.get(code)
+            if tile is None:
+                if code == path_code or cell in path_cells:
+                    tile = path_tile
+                elif code == visited_code or cell in visited_cells:
+                    tile = visited_tile
+                elif code == exploring_code or cell in exploring_cells:
+                    tile = exploring_tile
+                else:
+                    tile = empty_tile
+            blit_sequence.append((tile, (x_offset + col * cell_size, y_offset + row * cell_size)))
+        self._dirty_cells.clear()
+        return self.screen.blits(blit_sequence)
+    
+    def _cell_tiles(self) -> dict:
+        """Get one cell-sized surface per color key, filled with that color."""
+        key = (self.color_scheme, self.cell_size)
+        if self._tiles_key != key:
+            size = (self.cell_size - 1, self.cell_size - 1)
+            self._tiles = {}
+            for color_key in CELL_COLOR_KEYS:
+                tile = pygame.Surface(size).convert()
+                tile.fill(self.colors[color_key])
+                self._tiles[color_key] = tile
+            self._tiles_key = key
+        return self._tiles
     
     def handle_mouse_click(self, pos: Tuple[int, int], button: int):
         """Handle mouse click events."""
@@ -578,8 +784,10 @@ class PathfindingVisualizer:
         if button == 1:  # Left mouse button only for UI buttons
             for key, btn in self.buttons.items():
                 if btn.check_click(pos):
+                    self._panel_dirty = True  # Shows the button pressed
                     if key.startswith('alg_'):
                         self.current_algorithm = key.split('_')[1]
+                        self._current_alg_button = btn
                     elif key == 'start':
                         if not self.is_visualizing:
                             self.visualize_algorithm()
@@ -610,29 +818,31 @@ class PathfindingVisualizer:
                     elif key == 'speed_up':
                         self.visualization_speed = min(50, self.visualization_speed + 1)
                     elif key == 'color_default':
-                        self.color_scheme = 'default'
-                        self.colors = COLOR_SCHEMES[self.color_scheme]
-                        self.create_buttons()
+                        self.set_color_scheme('default')
                     elif key == 'color_dark':
-                        self.color_scheme = 'dark'
-                        self.colors = COLOR_SCHEMES[self.color_scheme]
-                        self.create_buttons()
+                        self.set_color_scheme('dark')
                     elif key == 'color_light':
-                        self.color_scheme = 'light'
-                        self.colors = COLOR_SCHEMES[self.color_scheme]
-                        self.create_buttons()
+                        self.set_color_scheme('light')
                     elif key == 'grid_small':
                         self.resize_grid('small')
                     elif key == 'grid_medium':
                         self.resize_grid('medium')
                     elif key == 'grid_large':
                         self.resize_grid('large')
+                    
+                    # Everything but the algorithm and speed buttons can
+                    # change the grid or the colors
+                    if not key.startswith(('alg_', 'speed_')):
+                        self.invalidate_all()
                     return
         
         # Handle grid clicks
         grid_pos = self.get_grid_pos(pos)
         if grid_pos and not self.is_visualizing:
             row, col = grid_pos
+            # The clicked cell, plus the old start/end in case one moves away
+            self._dirty_cells.update(cell for cell in (grid_pos, self.grid.start_pos,
+                                                       self.grid.end_pos) if cell)
             
             if button == 1:  # Left click - toggle wall
                 if self.grid.get_cell(row, col) not in [CellType.START, CellType.END]:
@@ -648,8 +858,10 @@ class PathfindingVisualizer:
             grid_pos = self.get_grid_pos(pos)
             if grid_pos:
                 row, col = grid_pos
-                if self.grid.get_cell(row, col) not in [CellType.START, CellType.END]:
+                # Most motion events land on a cell that is already a wall
+                if self.grid.get_cell(row, col) not in (CellType.WALL, CellType.START, CellType.END):
                     self.grid.set_cell(row, col, CellType.WALL)
+                    self._dirty_cells.add(grid_pos)
     
     def run(self):
         """Main application loop."""
@@ -658,6 +870,7 @@ class PathfindingVisualizer:
         mouse_down = False
         
         while running:
+            hover_pos = None
             for event in pygame.event.get():
                 if event.type == pygame.QUIT:
                     running = False
@@ -671,6 +884,7 @@ class PathfindingVisualizer:
                         self.path_cells.clear()
                         self.exploring_cells.clear()
                         self.result = None
+                        self.invalidate_all()
                     elif event.key == pygame.K_r:
                         self.grid.clear_all()
                         self.grid.set_cell(1, 1, CellType.START)
@@ -679,9 +893,11 @@ class PathfindingVisualizer:
                         self.path_cells.clear()
                         self.exploring_cells.clear()
                         self.result = None
+                        self.invalidate_all()
                     elif event.key == pygame.K_m:
                         if not self.is_visualizing:
                             self.grid.generate_maze_dfs()
+                            self.invalidate_all()
                 
                 elif event.type == pygame.MOUSEBUTTONDOWN:
                     mouse_down = True
@@ -691,9 +907,8 @@ class PathfindingVisualizer:
                     mouse_down = False
                 
                 elif event.type == pygame.MOUSEMOTION:
-                    # Check button hovers
-                    for btn in self.buttons.values():
-                        btn.check_hover(event.pos)
+                    # Only the latest position matters for hovering
+                    hover_pos = event.pos
                     
                     # Handle mouse drag for drawing
                     if mouse_down:
@@ -701,6 +916,16 @@ class PathfindingVisualizer:
                 
                 elif event.type == pygame.VIDEORESIZE:
                     self.handle_resize(event.size)
+                
+                elif event.type in _EXPOSE_EVENTS:
+                    self.invalidate_all()
+            
+            # Check button hovers (the panel only needs redrawing if one changed)
+            if hover_pos is not None:
+                for btn in self.buttons.values():
+                    was_hovered = btn.hovered
+                    if btn.check_hover(hover_pos) != was_hovered:
+                        self._panel_dirty = True
             
             self.draw()
             clock.tick(60)